@@ -12,6 +12,8 @@ setup(
         'h5py',
         'tensorflow',
         'pyzmq',
+        'msgpack',
+        'orjson',
         'scikit-learn',
         'Pillow',
         'boto3'
@@ -1,57 +1,48 @@
 from swisspollentools.utils import \
     ATTRIBUTE_SEP, EXTRACTION_WORKER_PREFIX, \
     INFERENCE_WORKER_PREFIX, TOCSVW_WORKER_PREFIX, \
-    MERGE_WORKER_PREFIX, get_subdictionary
+    MERGE_WORKER_PREFIX, split_dictionary
 from swisspollentools.workers import \
     ExtractionWorkerConfig, InferenceWorkerConfig, \
     MergeWorkerConfig, ToCSVWorkerConfig
 
 def InferencePipelineConfig(**kwargs):
+    kwargs = split_dictionary(
+        kwargs,
+        [EXTRACTION_WORKER_PREFIX, INFERENCE_WORKER_PREFIX,
+         TOCSVW_WORKER_PREFIX],
+        ATTRIBUTE_SEP, False
+    )
     exw_config = ExtractionWorkerConfig(
-        **get_subdictionary(
-            kwargs,
-            EXTRACTION_WORKER_PREFIX, ATTRIBUTE_SEP, False
-        )
-    )
-    inw_config = InferenceWorkerConfig(**{
-        **get_subdictionary(
-            kwargs,
-            INFERENCE_WORKER_PREFIX, ATTRIBUTE_SEP, False
-        )
-    })
-    tocsvw_config = ToCSVWorkerConfig(**{
-        **get_subdictionary(
-            kwargs,
-            TOCSVW_WORKER_PREFIX, ATTRIBUTE_SEP, False
-        )
-    })
+        **kwargs[EXTRACTION_WORKER_PREFIX]
+    )
+    inw_config = InferenceWorkerConfig(
+        **kwargs[INFERENCE_WORKER_PREFIX]
+    )
+    tocsvw_config = ToCSVWorkerConfig(
+        **kwargs[TOCSVW_WORKER_PREFIX]
+    )
 
     return exw_config, inw_config, tocsvw_config
 
 def MergedInferencePipelineConfig(**kwargs):
+    kwargs = split_dictionary(
+        kwargs,
+        [EXTRACTION_WORKER_PREFIX, INFERENCE_WORKER_PREFIX,
+         MERGE_WORKER_PREFIX, TOCSVW_WORKER_PREFIX],
+        ATTRIBUTE_SEP, False
+    )
     exw_config = ExtractionWorkerConfig(
-        **get_subdictionary(
-            kwargs,
-            EXTRACTION_WORKER_PREFIX, ATTRIBUTE_SEP, False
-        )
-    )
-    inw_config = InferenceWorkerConfig(**{
-        **get_subdictionary(
-            kwargs,
-            INFERENCE_WORKER_PREFIX, ATTRIBUTE_SEP, False
-        )
-    })
-    mew_config = MergeWorkerConfig(**{
-        **get_subdictionary(
-            kwargs,
-            MERGE_WORKER_PREFIX, ATTRIBUTE_SEP, False
-        )
-    })
-    tocsvw_config = ToCSVWorkerConfig(**{
-        **get_subdictionary(
-            kwargs,
-            TOCSVW_WORKER_PREFIX, ATTRIBUTE_SEP, False
-        )
-    })
+        **kwargs[EXTRACTION_WORKER_PREFIX]
+    )
+    inw_config = InferenceWorkerConfig(
+        **kwargs[INFERENCE_WORKER_PREFIX]
+    )
+    mew_config = MergeWorkerConfig(
+        **kwargs[MERGE_WORKER_PREFIX]
+    )
+    tocsvw_config = ToCSVWorkerConfig(
+        **kwargs[TOCSVW_WORKER_PREFIX]
+    )
 
     return exw_config, inw_config, mew_config, tocsvw_config
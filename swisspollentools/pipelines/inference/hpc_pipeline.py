@@ -2,19 +2,143 @@
 Implementation of the HPCInferencePipeline and the HPCMergedInferencePipeline
 """
 
-from  multiprocessing import Process
+import os
+import pickle
+import shutil
+import tempfile
+from functools import partial
+from  multiprocessing import Process, get_all_start_methods, get_start_method
 
 from swisspollentools.scaffolds import Collator, Sink, Ventilator
 from swisspollentools.utils import \
     ATTRIBUTE_SEP, EXTRACTION_WORKER_PREFIX, \
     INFERENCE_WORKER_PREFIX, TOCSVW_WORKER_PREFIX, \
-    MERGE_WORKER_PREFIX, get_subdictionary
+    MERGE_WORKER_PREFIX, set_cpu_affinity, split_dictionary
 from swisspollentools.workers import \
     ExtractionRequest, ExtractionWorker, \
     InferenceRequest, InferenceWorker, \
     MergeRequest, MergeWorker, \
     ToCSVRequest, ToCSVWorker
 
+def get_pinning_fn(pin_cpus):
+    """
+    Build the function binding the process kwargs to a CPU pinning
+
+    Arguments:
+    ----------
+    - pin_cpus: whether to pin the processes to the CPUs
+
+    Returns:
+    --------
+    - Callable taking the process kwargs and the process index and returning
+    the kwargs with an `on_startup` callable pinning the process to a CPU; the
+    processes are distributed over the available CPUs in a round-robin way.
+    """
+    if not pin_cpus or not hasattr(os, "sched_getaffinity"):
+        return lambda kwargs, index: kwargs
+
+    cpus = sorted(os.sched_getaffinity(0))
+
+    def pin(kwargs, index):
+        return {**kwargs, "on_startup": partial(
+            set_cpu_affinity,
+            cpus[index % len(cpus)],
+            kwargs.get("on_startup")
+        )}
+
+    return pin
+
+def get_channel_kwargs(transport="tcp"):
+    """
+    Build the channel kwargs of the scaffolds and workers of a pipeline run
+
+    Arguments:
+    ----------
+    - transport: transport of the channels, "tcp" or "ipc" (default is "tcp")
+
+    Returns:
+    --------
+    - Dictionary with the `transport` and `ipc_dir` kwargs; with the IPC
+    transport, the socket files are created in a new directory unique to the
+    run, so that concurrent runs on the same ports do not interfere.
+    """
+    if transport != "ipc":
+        return {"transport": transport, "ipc_dir": None}
+
+    return {
+        "transport": transport,
+        "ipc_dir": tempfile.mkdtemp(prefix="swisspollentools-")
+    }
+
+def run_pipeline(start, sequence, transport="tcp"):
+    """
+    Run a pipeline on the channels of a new run
+
+    Arguments:
+    ----------
+    - start: callable taking the sequence and the channel kwargs, starting
+    the processes of the pipeline and returning them
+    - sequence: sequence passed to `start`
+    - transport: transport of the channels, "tcp" or "ipc" (default is "tcp")
+
+    Returns:
+    --------
+    - None; with "ipc", the processes are joined and the directory of the
+    socket files is then removed, even if a stage fails; with "tcp", the
+    function returns once the processes are started.
+    """
+    channels = get_channel_kwargs(transport)
+    try:
+        processes = start(sequence, channels)
+        if channels["ipc_dir"] is not None:
+            for process in processes:
+                process.join()
+    finally:
+        if channels["ipc_dir"] is not None:
+            shutil.rmtree(channels["ipc_dir"], ignore_errors=True)
+
+def prepickle_kwargs(kwargs):
+    """
+    Pickle the worker kwargs once for all the processes of a worker
+
+    With the `spawn` and `forkserver` start methods, the kwargs of each
+    process are pickled again on start, which is costly for large objects such
+    as models. The kwargs are instead pickled once and passed as `get_`
+    kwargs, unpickled by the worker on startup.
+
+    Arguments:
+    ----------
+    - kwargs: worker kwargs
+
+    Returns:
+    --------
+    - Worker kwargs, unchanged with the `fork` start method; the kwargs with a
+    `get_` counterpart are also left unchanged, the `get_` kwarg provided by
+    the user takes precedence in the worker.
+    """
+    # The start method is only read, without fixing it if it was not set yet;
+    # the first supported method is then the default one
+    start_method = get_start_method(allow_none=True) or \
+        get_all_start_methods()[0]
+    if start_method == "fork":
+        return kwargs
+
+    wrapper_keys = (
+        "timeout", "on_startup", "on_request", "on_response", "on_failure",
+        "on_closure"
+    )
+
+    pickled_kwargs = {}
+    for k, v in kwargs.items():
+        if k in wrapper_keys or k.startswith("get_") or "get_" + k in kwargs:
+            pickled_kwargs[k] = v
+        else:
+            pickled_kwargs["get_" + k] = (
+                pickle.loads, pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+
+    return pickled_kwargs
+
 def HPCInferencePipeline(
     config,
     n_exw,
@@ -23,6 +147,8 @@ def HPCInferencePipeline(
     ports,
     c_ports,
     s_ports,
+    pin_cpus=False,
+    transport="tcp",
     **kwargs
 ):
     """
@@ -38,6 +164,11 @@ def HPCInferencePipeline(
     - ports: list of ports for the data-flow
     - c_ports: list of ports for the control channels
     - s_ports: list of ports for the scaffold channels
+    - pin_cpus: whether to pin each worker and scaffold process to a CPU,
+    the workers are assigned to the CPUs first (default is False)
+    - transport: transport of the channels, "tcp" or "ipc" (default is
+    "tcp"); with "ipc", each run creates its socket files in a new temporary
+    directory and waits for all its processes before removing it
     - kwargs: list of keyword arguments for the scaffolds and workers:
         - the keyword arguments should have a prefix (`__v` for ventilator,
         `__c1` for the first collator, `__c2` for the second collator and `__s`
@@ -51,50 +182,50 @@ def HPCInferencePipeline(
     """
     exw_config, inw_config, tocsvw_config = config
 
+    kwargs = split_dictionary(kwargs, [
+        "__v", "__c1", "__c2", "__s",
+        EXTRACTION_WORKER_PREFIX, INFERENCE_WORKER_PREFIX, TOCSVW_WORKER_PREFIX
+    ], ATTRIBUTE_SEP)
+
     # Extract the scaffold kwargs: 
-    __v_kwargs = get_subdictionary(kwargs, "__v", ATTRIBUTE_SEP)
-    __c1_kwargs = get_subdictionary(kwargs, "__c1", ATTRIBUTE_SEP)
-    __c2_kwargs = get_subdictionary(kwargs, "__c2", ATTRIBUTE_SEP)
-    __s_kwargs = get_subdictionary(kwargs, "__s", ATTRIBUTE_SEP)
+    __v_kwargs = kwargs["__v"]
+    __c1_kwargs = kwargs["__c1"]
+    __c2_kwargs = kwargs["__c2"]
+    __s_kwargs = kwargs["__s"]
 
     # Extract the worker kwargs
-    exw_kwargs = get_subdictionary(kwargs, EXTRACTION_WORKER_PREFIX, ATTRIBUTE_SEP)
-    inw_kwargs = get_subdictionary(kwargs, INFERENCE_WORKER_PREFIX, ATTRIBUTE_SEP)
-    tocsvw_kwargs = get_subdictionary(kwargs, TOCSVW_WORKER_PREFIX, ATTRIBUTE_SEP)
+    exw_kwargs = kwargs[EXTRACTION_WORKER_PREFIX]
+    inw_kwargs = kwargs[INFERENCE_WORKER_PREFIX]
+    tocsvw_kwargs = kwargs[TOCSVW_WORKER_PREFIX]
 
-    def run(sequence):
-        """
-        Inference pipeline function
+    pin = get_pinning_fn(pin_cpus)
 
-        Arguments:
-        ----------
-        - sequence: a list of Poleno Zip file path
+    def start(sequence, channels):
+        exw_pickled_kwargs = {**prepickle_kwargs(exw_kwargs), **channels}
+        inw_pickled_kwargs = {**prepickle_kwargs(inw_kwargs), **channels}
+        tocsvw_pickled_kwargs = {**prepickle_kwargs(tocsvw_kwargs), **channels}
+        s_kwargs = {**__s_kwargs, **channels}
 
-        Returns:
-        --------
-        - None
-        """
-        
         # Create the scaffolds
         ventilator = Process(
             target=Ventilator,
             args=(sequence, ExtractionRequest, ports[0], s_ports[0]),
-            kwargs=__v_kwargs
+            kwargs=pin({"n_workers": n_exw, **__v_kwargs, **channels}, n_exw + n_inw + n_tocsvw)
         )
         collator_1 = Process(
             target=Collator,
             args=(InferenceRequest, ports[1], ports[2], c_ports[0], (s_ports[0], s_ports[1])),
-            kwargs=__c1_kwargs
+            kwargs=pin({"n_workers": n_inw, **__c1_kwargs, **channels}, n_exw + n_inw + n_tocsvw + 1)
         )
         collator_2 = Process(
             target=Collator,
             args=(ToCSVRequest, ports[3], ports[4], c_ports[1], (s_ports[1], s_ports[2])),
-            kwargs=__c2_kwargs
+            kwargs=pin({"n_workers": n_tocsvw, **__c2_kwargs, **channels}, n_exw + n_inw + n_tocsvw + 2)
         )
         sink = Process(
             target=Sink,
             args=(ports[5], c_ports[2], s_ports[2]),
-            kwargs=__s_kwargs
+            kwargs=pin(s_kwargs, n_exw + n_inw + n_tocsvw + 3)
         )
 
         # Start the scaffolds
@@ -107,18 +238,18 @@ def HPCInferencePipeline(
         extraction_workers = [Process(
             target=ExtractionWorker,
             args=(exw_config, ports[0], ports[1], c_ports[0]),
-            kwargs=exw_kwargs
-        ) for _ in range(n_exw)]
+            kwargs=pin(exw_pickled_kwargs, i)
+        ) for i in range(n_exw)]
         inference_workers = [Process(
             target=InferenceWorker,
             args=(inw_config, ports[2], ports[3], c_ports[1]),
-            kwargs=inw_kwargs
-        ) for _ in range(n_inw)]
+            kwargs=pin(inw_pickled_kwargs, n_exw + i)
+        ) for i in range(n_inw)]
         tocsv_workers = [Process(
             target=ToCSVWorker,
             args=(tocsvw_config, ports[4], ports[5], c_ports[2]),
-            kwargs=tocsvw_kwargs
-        ) for _ in range(n_tocsvw)]
+            kwargs=pin(tocsvw_pickled_kwargs, n_exw + n_inw + i)
+        ) for i in range(n_tocsvw)]
 
         # Start the workers
         for worker in extraction_workers:
@@ -128,6 +259,25 @@ def HPCInferencePipeline(
         for worker in tocsv_workers:
             worker.start()
 
+        return [
+            ventilator, collator_1, collator_2, sink,
+            *extraction_workers, *inference_workers, *tocsv_workers
+        ]
+
+    def run(sequence):
+        """
+        Inference pipeline function
+
+        Arguments:
+        ----------
+        - sequence: a list of Poleno Zip file path
+
+        Returns:
+        --------
+        - None
+        """
+        run_pipeline(start, sequence, transport)
+
     return run
 
 def HPCMergedInferencePipeline(
@@ -138,46 +288,62 @@ def HPCMergedInferencePipeline(
     ports,
     c_ports,
     s_ports,
+    pin_cpus=False,
+    transport="tcp",
     **kwargs
 ):
     exw_config, inw_config, mew_config, tocsvw_config = config
 
-    __v_kwargs = get_subdictionary(kwargs, "__v", ATTRIBUTE_SEP)
-    __c1_kwargs = get_subdictionary(kwargs, "__c1", ATTRIBUTE_SEP)
-    __c2_kwargs = get_subdictionary(kwargs, "__c2", ATTRIBUTE_SEP)
-    __c3_kwargs = get_subdictionary(kwargs, "__c3", ATTRIBUTE_SEP)
-    __s_kwargs = get_subdictionary(kwargs, "__s", ATTRIBUTE_SEP)
+    kwargs = split_dictionary(kwargs, [
+        "__v", "__c1", "__c2", "__c3", "__s",
+        EXTRACTION_WORKER_PREFIX, INFERENCE_WORKER_PREFIX,
+        MERGE_WORKER_PREFIX, TOCSVW_WORKER_PREFIX
+    ], ATTRIBUTE_SEP)
 
-    exw_kwargs = get_subdictionary(kwargs, EXTRACTION_WORKER_PREFIX, ATTRIBUTE_SEP)
-    inw_kwargs = get_subdictionary(kwargs, INFERENCE_WORKER_PREFIX, ATTRIBUTE_SEP)
-    mew_kwargs = get_subdictionary(kwargs, MERGE_WORKER_PREFIX, ATTRIBUTE_SEP)
-    tocsvw_kwargs = get_subdictionary(kwargs, TOCSVW_WORKER_PREFIX, ATTRIBUTE_SEP)
+    __v_kwargs = kwargs["__v"]
+    __c1_kwargs = kwargs["__c1"]
+    __c2_kwargs = kwargs["__c2"]
+    __c3_kwargs = kwargs["__c3"]
+    __s_kwargs = kwargs["__s"]
+
+    exw_kwargs = kwargs[EXTRACTION_WORKER_PREFIX]
+    inw_kwargs = kwargs[INFERENCE_WORKER_PREFIX]
+    mew_kwargs = kwargs[MERGE_WORKER_PREFIX]
+    tocsvw_kwargs = kwargs[TOCSVW_WORKER_PREFIX]
+
+    pin = get_pinning_fn(pin_cpus)
+
+    def start(sequence, channels):
+        exw_pickled_kwargs = {**prepickle_kwargs(exw_kwargs), **channels}
+        inw_pickled_kwargs = {**prepickle_kwargs(inw_kwargs), **channels}
+        mew_pickled_kwargs = {**prepickle_kwargs(mew_kwargs), **channels}
+        tocsvw_pickled_kwargs = {**prepickle_kwargs(tocsvw_kwargs), **channels}
+        s_kwargs = {**__s_kwargs, **channels}
 
-    def run(sequence):
         ventilator = Process(
             target=Ventilator,
             args=(sequence, ExtractionRequest, ports[0], s_ports[0]),
-            kwargs=__v_kwargs
+            kwargs=pin({"n_workers": n_exw, **__v_kwargs, **channels}, n_exw + n_inw + n_tocsvw + 1)
         )
         collator_1 = Process(
             target=Collator,
             args=(InferenceRequest, ports[1], ports[2], c_ports[0], (s_ports[0], s_ports[1])),
-            kwargs=__c1_kwargs
+            kwargs=pin({"n_workers": n_inw, **__c1_kwargs, **channels}, n_exw + n_inw + n_tocsvw + 2)
         )
         collator_2 = Process(
             target=Collator,
             args=(MergeRequest, ports[3], ports[4], c_ports[1], (s_ports[1], s_ports[2])),
-            kwargs=__c2_kwargs
+            kwargs=pin({"n_workers": 1, **__c2_kwargs, **channels}, n_exw + n_inw + n_tocsvw + 3)
         )
         collator_3 = Process(
             target=Collator,
             args=(ToCSVRequest, ports[5], ports[6], c_ports[2], (s_ports[2], s_ports[3])),
-            kwargs=__c3_kwargs
+            kwargs=pin({"n_workers": n_tocsvw, **__c3_kwargs, **channels}, n_exw + n_inw + n_tocsvw + 4)
         )
         sink = Process(
             target=Sink,
             args=(ports[7], c_ports[3], s_ports[3]),
-            kwargs=__s_kwargs
+            kwargs=pin(s_kwargs, n_exw + n_inw + n_tocsvw + 5)
         )
 
         ventilator.start()
@@ -189,23 +355,23 @@ def HPCMergedInferencePipeline(
         extraction_workers = [Process(
             target=ExtractionWorker,
             args=(exw_config, ports[0], ports[1], c_ports[0]),
-            kwargs=exw_kwargs
-        ) for _ in range(n_exw)]
+            kwargs=pin(exw_pickled_kwargs, i)
+        ) for i in range(n_exw)]
         inference_workers = [Process(
             target=InferenceWorker,
             args=(inw_config, ports[2], ports[3], c_ports[1]),
-            kwargs=inw_kwargs
-        ) for _ in range(n_inw)]
+            kwargs=pin(inw_pickled_kwargs, n_exw + i)
+        ) for i in range(n_inw)]
         merge_worker = Process(
             target=MergeWorker,
             args=(mew_config, ports[4], ports[5], c_ports[2]),
-            kwargs=mew_kwargs
+            kwargs=pin(mew_pickled_kwargs, n_exw + n_inw)
         )
         tocsv_workers = [Process(
             target=ToCSVWorker,
             args=(tocsvw_config, ports[6], ports[7], c_ports[3]),
-            kwargs=tocsvw_kwargs
-        ) for _ in range(n_tocsvw)]
+            kwargs=pin(tocsvw_pickled_kwargs, n_exw + n_inw + 1 + i)
+        ) for i in range(n_tocsvw)]
 
         for worker in extraction_workers:
             worker.start()
@@ -215,4 +381,13 @@ def HPCMergedInferencePipeline(
         for worker in tocsv_workers:
             worker.start()
 
+        return [
+            ventilator, collator_1, collator_2, collator_3, sink,
+            *extraction_workers, *inference_workers, merge_worker,
+            *tocsv_workers
+        ]
+
+    def run(sequence):
+        run_pipeline(start, sequence, transport)
+
     return run
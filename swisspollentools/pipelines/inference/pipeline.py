@@ -1,7 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from swisspollentools.utils import \
     ATTRIBUTE_SEP, EXTRACTION_WORKER_PREFIX, \
     INFERENCE_WORKER_PREFIX, TOCSVW_WORKER_PREFIX, \
-    MERGE_WORKER_PREFIX, get_subdictionary
+    MERGE_WORKER_PREFIX, split_dictionary
 from swisspollentools.workers import \
     ExtractionRequest, ZipExtraction, \
     InferenceRequest, Inference, \
@@ -10,18 +12,15 @@ from swisspollentools.workers import \
 
 def InferencePipeline(config, **kwargs):
     exw_config, inw_config, tocsvw_config = config
-    exw_kwargs = get_subdictionary(
-        kwargs,
-        EXTRACTION_WORKER_PREFIX, ATTRIBUTE_SEP
-    )
-    inw_kwargs = get_subdictionary(
-        kwargs,
-        INFERENCE_WORKER_PREFIX, ATTRIBUTE_SEP
-    )
-    tocsvw_kwargs = get_subdictionary(
+    kwargs = split_dictionary(
         kwargs,
-        TOCSVW_WORKER_PREFIX, ATTRIBUTE_SEP
+        [EXTRACTION_WORKER_PREFIX, INFERENCE_WORKER_PREFIX,
+         TOCSVW_WORKER_PREFIX],
+        ATTRIBUTE_SEP
     )
+    exw_kwargs = kwargs[EXTRACTION_WORKER_PREFIX]
+    inw_kwargs = kwargs[INFERENCE_WORKER_PREFIX]
+    tocsvw_kwargs = kwargs[TOCSVW_WORKER_PREFIX]
 
     def run(file_path):
         out = ExtractionRequest(file_path=file_path)
@@ -32,31 +31,40 @@ def InferencePipeline(config, **kwargs):
                     for el in out)
         out = (ToCSVRequest(file_path, batch_id, response=el) \
                     for batch_id, el in enumerate(out))
-        out = (ToCSV(el, tocsvw_config, **tocsvw_kwargs).__next__() \
-                    for el in out)
 
-        return list(out)
+        # The CSV writes are submitted to a background thread so that the
+        # disk I/O of a batch overlaps with the extraction and inference of
+        # the next one. At most one write is pending at a time, so that the
+        # batches are streamed instead of accumulating in memory when the
+        # disk is slower than the inference.
+        responses, pending = [], None
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for el in out:
+                if pending is not None:
+                    responses.append(pending.result())
+                pending = executor.submit(
+                    next, ToCSV(el, tocsvw_config, **tocsvw_kwargs)
+                )
+
+            if pending is not None:
+                responses.append(pending.result())
+
+        return responses
 
     return run
 
 def MergedInferencePipeline(config, **kwargs):
     exw_config, inw_config, mew_config, tocsvw_config = config
-    exw_kwargs = get_subdictionary(
-        kwargs,
-        EXTRACTION_WORKER_PREFIX, ATTRIBUTE_SEP
-    )
-    inw_kwargs = get_subdictionary(
-        kwargs,
-        INFERENCE_WORKER_PREFIX, ATTRIBUTE_SEP
-    )
-    mew_kwargs = get_subdictionary(
-        kwargs,
-        MERGE_WORKER_PREFIX, ATTRIBUTE_SEP
-    )
-    tocsvw_kwargs = get_subdictionary(
+    kwargs = split_dictionary(
         kwargs,
-        TOCSVW_WORKER_PREFIX, ATTRIBUTE_SEP
+        [EXTRACTION_WORKER_PREFIX, INFERENCE_WORKER_PREFIX,
+         MERGE_WORKER_PREFIX, TOCSVW_WORKER_PREFIX],
+        ATTRIBUTE_SEP
     )
+    exw_kwargs = kwargs[EXTRACTION_WORKER_PREFIX]
+    inw_kwargs = kwargs[INFERENCE_WORKER_PREFIX]
+    mew_kwargs = kwargs[MERGE_WORKER_PREFIX]
+    tocsvw_kwargs = kwargs[TOCSVW_WORKER_PREFIX]
 
     def run(file_path):
         out = ExtractionRequest(file_path=file_path)
@@ -6,15 +6,16 @@ cardinality pipelines in an HPC (High-Performance Computing) environment. It
 works with PyZMQ for communication and utilizes utility functions from the 
 SwissPollenTools library.
 """
-import time
 from typing import Callable, Optional, Tuple
 
 import zmq
 
 from swisspollentools.utils import \
-    LAUNCH_SLEEP_TIME, FILE_PATH_KEY, BATCH_ID_KEY, N_ITEMS_KEY, \
-    send_request, recv_request, \
-    ExpectedNItems, EndOfProcess, isexnit, iseot
+    FILE_PATH_KEY, BATCH_ID_KEY, N_ITEMS_KEY, END_OF_TASK_KEY, \
+    LAUNCH_SLEEP_TIME, \
+    get_address, remove_address, send_request, recv_request, \
+    send_expected_n_items, send_end_of_process, wait_for_connections, \
+    isexnit, iseot, haseot
 
 def Collator(
     request_fn: Callable,
@@ -24,6 +25,9 @@ def Collator(
     scaffold_ports: Tuple[int],
     on_startup: Optional[Callable]=None,
     on_closure: Optional[Callable]=None,
+    n_workers: Optional[int]=None,
+    transport: str="tcp",
+    ipc_dir: Optional[str]=None,
     **kwargs
 ):
     """
@@ -42,6 +46,11 @@ def Collator(
     on scaffold startup.
     - on_closure (Optional[Callable]): An optional callback function to execute
     on scaffold closure.
+    - n_workers (Optional[int]): The number of downstream workers, the
+    forwarding starts once they are all connected if given.
+    - transport (str): The transport of the channels, "tcp" or "ipc".
+    - ipc_dir (Optional[str]): The directory of the socket files of the IPC
+    transport.
     - **kwargs (Any): Additional keyword arguments for the request processing
     function.
 
@@ -70,6 +79,13 @@ def Collator(
     - The Collator scaffold creates ZeroMQ sockets for communication, processes
     incoming requests using the provided `request_fn` function, and handles 
     control messages for efficient pipeline coordination.
+    - With `n_workers`, the Collator waits for all its downstream workers to
+    be connected before forwarding, at most `LAUNCH_SLEEP_TIME` seconds, so
+    that the requests are balanced among them. The upstream responses are
+    queued in the meantime.
+    - A task of the upstream workers is closed either by an EndOfTask message
+    or by its last response, flagged with `END_OF_TASK_KEY` (see `haseot`).
+    The flag is removed before the response is passed to `request_fn`.
     """
     if on_startup is not None:
         on_startup()
@@ -78,58 +94,83 @@ def Collator(
 
     # Set PULL binding
     receiver = context.socket(zmq.PULL)
-    receiver.bind(f"tcp://127.0.0.1:{pull_port}")
+    receiver.bind(get_address(pull_port, transport, ipc_dir))
 
     # Set PUSH binding
     sender = context.socket(zmq.PUSH)
-    sender.bind(f"tcp://127.0.0.1:{push_port}")
+    monitor = sender.get_monitor_socket(zmq.EVENT_HANDSHAKE_SUCCEEDED) \
+        if n_workers is not None else None
+    sender.bind(get_address(push_port, transport, ipc_dir))
 
     # Set control binding (PUB/SUB channel)
     control = context.socket(zmq.PUB)
-    control.bind(f"tcp://127.0.0.1:{control_port}")
+    control.bind(get_address(control_port, transport, ipc_dir))
 
     scaffold_receiver = context.socket(zmq.PAIR)
-    scaffold_receiver.connect(f"tcp://127.0.0.1:{scaffold_ports[0]}")
+    scaffold_receiver.connect(
+        get_address(scaffold_ports[0], transport, ipc_dir)
+    )
 
     scaffold_sender = context.socket(zmq.PAIR)
-    scaffold_sender.bind(f"tcp://127.0.0.1:{scaffold_ports[1]}")
+    scaffold_sender.bind(get_address(scaffold_ports[1], transport, ipc_dir))
+
+    if n_workers is not None:
+        wait_for_connections(sender, monitor, n_workers, LAUNCH_SLEEP_TIME)
 
     poller = zmq.Poller()
     poller.register(receiver, zmq.POLLIN)
     poller.register(scaffold_receiver, zmq.POLLIN)
 
-    time.sleep(LAUNCH_SLEEP_TIME)
+    # Specialize the request processing once, so that the message loop does
+    # not expand the keyword arguments when there are none.
+    if kwargs:
+        def apply_request_fn(request):
+            return request_fn(
+                file_path=request[FILE_PATH_KEY],
+                batch_id=request[BATCH_ID_KEY],
+                response=request,
+                **kwargs
+            )
+    else:
+        def apply_request_fn(request):
+            return request_fn(
+                file_path=request[FILE_PATH_KEY],
+                batch_id=request[BATCH_ID_KEY],
+                response=request
+            )
 
     n_tasks = float("inf")
     eot_counter = 0
     n_tasks_counter = 0
     while eot_counter < n_tasks:
-        socks = dict(poller.poll())
+        for socket, _ in poller.poll():
+            if socket is receiver:
+                request = recv_request(receiver)
 
-        if socks.get(receiver) == zmq.POLLIN:
-            request = recv_request(receiver)
+                if iseot(request):
+                    eot_counter += 1
+                    continue
 
-            if iseot(request):
-                eot_counter += 1
-                continue
+                # The last response of a task closes it as well
+                if haseot(request):
+                    eot_counter += 1
+                    del request[END_OF_TASK_KEY]
 
-            request = request_fn(
-                file_path=request[FILE_PATH_KEY],
-                batch_id=request[BATCH_ID_KEY],
-                response=request,
-                **kwargs
-            )
-            send_request(sender, request)
-            n_tasks_counter += 1
+                request = apply_request_fn(request)
+                send_request(sender, request)
+                n_tasks_counter += 1
+
+            elif socket is scaffold_receiver:
+                request = recv_request(scaffold_receiver)
 
-        if socks.get(scaffold_receiver) == zmq.POLLIN:
-            request = recv_request(scaffold_receiver)
+                if isexnit(request):
+                    n_tasks = request[N_ITEMS_KEY]
 
-            if isexnit(request):
-                n_tasks = request[N_ITEMS_KEY]
+    send_expected_n_items(scaffold_sender, n_tasks_counter)
+    send_end_of_process(control)
 
-    send_request(scaffold_sender, ExpectedNItems(n_tasks_counter))
-    send_request(control, EndOfProcess())
+    for port in (pull_port, push_port, control_port, scaffold_ports[1]):
+        remove_address(get_address(port, transport, ipc_dir))
 
     if on_closure is not None:
         on_closure()
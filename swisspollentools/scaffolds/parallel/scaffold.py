@@ -13,9 +13,10 @@ from typing import Callable, List, Optional, Tuple
 import zmq
 
 from swisspollentools.utils import \
-    LAUNCH_SLEEP_TIME, N_ITEMS_KEY, \
-    recv_request, send_request, \
-    ExpectedNItems, isexnit, iseot
+    N_ITEMS_KEY, LAUNCH_SLEEP_TIME, \
+    get_address, remove_address, recv_request, send_expected_n_items, \
+    wait_for_connections, \
+    isexnit
 
 def Parallel(
     pull_port: int,
@@ -23,6 +24,9 @@ def Parallel(
     scaffold_ports: Tuple[int],
     on_startup: Optional[Callable]=None,
     on_closure: Optional[Callable]=None,
+    n_workers: Optional[List[int]]=None,
+    transport: str="tcp",
+    ipc_dir: Optional[str]=None,
     **kwargs
 ):
     """
@@ -39,6 +43,12 @@ def Parallel(
     on scaffold startup.
     - on_closure (Optional[Callable]): An optional callback function to execute
     on scaffold closure.
+    - n_workers (Optional[List[int]]): The number of downstream workers of
+    each push port, the forwarding starts once they are all connected if
+    given.
+    - transport (str): The transport of the channels, "tcp" or "ipc".
+    - ipc_dir (Optional[str]): The directory of the socket files of the IPC
+    transport.
     - **kwargs (Any): Additional keyword arguments.
 
     Returns:
@@ -60,55 +70,78 @@ def Parallel(
     The Parallel scaffold creates ZeroMQ sockets for communication, runs
     multiple tasks in parallel on a single message, and handles control
     messages for efficient pipeline coordination.
+    - Incoming messages are forwarded as raw frames: the request is never
+    deserialized nor serialized again, and the same frames are shared by all
+    the downstream sockets.
+    - With `n_workers`, the Parallel scaffold waits for all its downstream
+    workers to be connected before forwarding, at most `LAUNCH_SLEEP_TIME`
+    seconds, so that the requests are balanced among them.
     """
     if not len(push_ports) == len(scaffold_ports) - 1:
         raise ValueError()
 
+    if n_workers is not None and not len(n_workers) == len(push_ports):
+        raise ValueError()
+
     if on_startup is not None:
         on_startup()
 
     context = zmq.Context()
 
     receiver = context.socket(zmq.PULL)
-    receiver.connect(f"tcp://127.0.0.1:{pull_port}")
+    receiver.connect(get_address(pull_port, transport, ipc_dir))
 
     senders = [context.socket(zmq.PUSH) for _ in push_ports]
+    monitors = [
+        sender.get_monitor_socket(zmq.EVENT_HANDSHAKE_SUCCEEDED) \
+            for sender in senders
+    ] if n_workers is not None else None
     for sender, push_port in zip(senders, push_ports):
-        sender.bind(f"tcp://127.0.0.1:{push_port}")
+        sender.bind(get_address(push_port, transport, ipc_dir))
 
     scaffold_receiver = context.socket(zmq.PAIR)
-    scaffold_receiver.connect(f"tcp://127.0.0.1:{scaffold_ports[0]}")
+    scaffold_receiver.connect(
+        get_address(scaffold_ports[0], transport, ipc_dir)
+    )
 
     scaffold_senders = [context.socket(zmq.PAIR) for _ in scaffold_ports[1:]]
     for sender, scaffold_port in zip(scaffold_senders, scaffold_ports[1:]):
-        sender.bind(f"tcp://127.0.0.1:{scaffold_port}")
+        sender.bind(get_address(scaffold_port, transport, ipc_dir))
+
+    if n_workers is not None:
+        # The waits share a single deadline
+        deadline = time.monotonic() + LAUNCH_SLEEP_TIME
+        for sender, monitor, n in zip(senders, monitors, n_workers):
+            wait_for_connections(
+                sender, monitor, n, max(deadline - time.monotonic(), 0)
+            )
 
     poller = zmq.Poller()
     poller.register(receiver, zmq.POLLIN)
     poller.register(scaffold_receiver, zmq.POLLIN)
 
-    time.sleep(LAUNCH_SLEEP_TIME)
-
     n_tasks = float("inf")
     n_tasks_counter = 0
     while n_tasks_counter < n_tasks:
-        socks = dict(poller.poll())
-
-        if socks.get(receiver) == zmq.POLLIN:
-            request = recv_request(receiver)
+        for socket, _ in poller.poll():
+            if socket is receiver:
+                frames = receiver.recv_multipart(copy=False)
 
-            for sender in senders:
-                send_request(sender, request)
-            n_tasks_counter += 1
+                for sender in senders:
+                    sender.send_multipart(frames, copy=False)
+                n_tasks_counter += 1
 
-        if socks.get(scaffold_receiver) == zmq.POLLIN:
-            request = recv_request(scaffold_receiver)
+            elif socket is scaffold_receiver:
+                request = recv_request(scaffold_receiver)
 
-            if isexnit(request):
-                n_tasks = request[N_ITEMS_KEY]
+                if isexnit(request):
+                    n_tasks = request[N_ITEMS_KEY]
 
     for scaffold_sender in scaffold_senders:
-        send_request(scaffold_sender, ExpectedNItems(n_tasks_counter))
+        send_expected_n_items(scaffold_sender, n_tasks_counter)
+
+    for port in (*push_ports, *scaffold_ports[1:]):
+        remove_address(get_address(port, transport, ipc_dir))
 
     if on_closure is not None:
         on_closure()
@@ -6,15 +6,15 @@ last layer of workers in an HPC (High-Performance Computing) environment. It
 employs PyZMQ for communication and utilizes utility functions from the
 SwissPollenTools library.
 """
-import time
 from typing import Callable, Optional
 
 import zmq
 
 from swisspollentools.utils import \
-    LAUNCH_SLEEP_TIME, N_ITEMS_KEY, \
-    send_request, recv_request, \
-    EndOfProcess, isexnit, iseot
+    N_ITEMS_KEY, \
+    get_address, remove_address, recv_request, recv_request_header, \
+    send_end_of_process, \
+    isexnit, haseot
 
 def Sink(
     pull_port: int,
@@ -22,6 +22,8 @@ def Sink(
     scaffold_port: int,
     on_startup: Optional[Callable]=None,
     on_closure: Optional[Callable]=None,
+    transport: str="tcp",
+    ipc_dir: Optional[str]=None,
     **kwargs
 ):
     """
@@ -37,6 +39,9 @@ def Sink(
     on scaffold startup.
     - on_closure (Optional[Callable]): An optional callback function to execute
     on scaffold closure.
+    - transport (str): The transport of the channels, "tcp" or "ipc".
+    - ipc_dir (Optional[str]): The directory of the socket files of the IPC
+    transport.
     - **kwargs (Any): Additional keyword arguments.
 
     Returns:
@@ -59,6 +64,10 @@ def Sink(
     responses from the last layer of workers, handles control messages for
     efficient pipeline coordination, and signals the end of the process when
     the expected number of tasks is received.
+    - A task of the last layer of workers is closed either by an EndOfTask
+    message or by its last response, flagged with `END_OF_TASK_KEY`; the
+    tasks are therefore counted with `haseot`, `iseot` only matches the
+    former.
     """
 
     if on_startup is not None:
@@ -68,39 +77,48 @@ def Sink(
 
     # Set PULL binding
     receiver = context.socket(zmq.PULL)
-    receiver.bind(f"tcp://127.0.0.1:{pull_port}")
+    receiver.bind(get_address(pull_port, transport, ipc_dir))
 
     # Set control binding (PUB/SUB channel)
     control = context.socket(zmq.PUB)
-    control.bind(f"tcp://127.0.0.1:{control_port}")
+    control.bind(get_address(control_port, transport, ipc_dir))
 
     scaffold_receiver = context.socket(zmq.PAIR)
-    scaffold_receiver.connect(f"tcp://127.0.0.1:{scaffold_port}")
+    scaffold_receiver.connect(get_address(scaffold_port, transport, ipc_dir))
 
     poller = zmq.Poller()
     poller.register(receiver, zmq.POLLIN)
     poller.register(scaffold_receiver, zmq.POLLIN)
 
-    time.sleep(LAUNCH_SLEEP_TIME)
-
-    n_tasks = float("inf")
+    # Integer state instead of an infinite float sentinel, the loop condition
+    # only involves integer comparisons
+    n_tasks_known = False
+    n_tasks = 0
     eot_counter = 0
-    while eot_counter < n_tasks:
-        socks = dict(poller.poll())
-
-        if socks.get(receiver) == zmq.POLLIN:
-            request = recv_request(receiver)
-
-            if iseot(request):
-                eot_counter += 1
-
-        if socks.get(scaffold_receiver) == zmq.POLLIN:
-            request = recv_request(scaffold_receiver)
-
-            if isexnit(request):
-                n_tasks = request[N_ITEMS_KEY]
-
-    send_request(control, EndOfProcess())
+    while not n_tasks_known or eot_counter < n_tasks:
+        for socket, _ in poller.poll():
+            if socket is receiver:
+                # Drain all the queued messages on a single wake-up; reading
+                # the socket events does not involve a system call.
+                while receiver.getsockopt(zmq.EVENTS) & zmq.POLLIN:
+                    request = recv_request_header(receiver)
+
+                    # Either an EndOfTask message or the last response
+                    # of a task
+                    if haseot(request):
+                        eot_counter += 1
+
+            elif socket is scaffold_receiver:
+                request = recv_request(scaffold_receiver)
+
+                if isexnit(request):
+                    n_tasks = request[N_ITEMS_KEY]
+                    n_tasks_known = True
+
+    send_end_of_process(control)
+
+    for port in (pull_port, control_port):
+        remove_address(get_address(port, transport, ipc_dir))
 
     if on_closure is not None:
         on_closure()
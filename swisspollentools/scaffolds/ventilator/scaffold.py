@@ -8,13 +8,58 @@ environment. It utilizes PyZMQ for communication and leverages utility
 functions from the SwissPollenTools library.
 """
 import time
-from typing import Iterable, Callable, Optional
+from functools import partial
+from queue import Queue
+from threading import Thread
+from typing import Iterable, Callable, List, Optional
 
 import zmq
 
 from swisspollentools.utils import \
-    LAUNCH_SLEEP_TIME, \
-    send_request, ExpectedNItems
+    LAUNCH_SLEEP_TIME, VENTILATOR_SNDHWM, VENTILATOR_SNDBUF, \
+    VENTILATOR_QUEUE_SIZE, \
+    get_address, remove_address, send_request, send_expected_n_items, \
+    wait_for_connections
+
+def _send_requests(
+    socket: zmq.Socket,
+    requests: Queue,
+    errors: List[Exception],
+    monitor: Optional[zmq.Socket]=None,
+    n_workers: Optional[int]=None
+):
+    """
+    Send the requests of a queue until a None sentinel is received.
+
+    Parameters:
+    - socket (zmq.Socket): ZeroMQ socket for communication.
+    - requests (Queue): The queue of the requests to be sent.
+    - errors (List[Exception]): A list where the sending error is stored.
+    - monitor (Optional[zmq.Socket]): Monitor socket of `socket`, required
+    with `n_workers`.
+    - n_workers (Optional[int]): The number of workers to wait for before
+    sending, the sending is delayed by `LAUNCH_SLEEP_TIME` seconds if None.
+
+    Returns:
+    None
+
+    Note:
+    - After an error the queue is still consumed, without sending, so that
+    the producer is never blocked on a full queue.
+    """
+    if n_workers is None:
+        time.sleep(LAUNCH_SLEEP_TIME)
+    else:
+        wait_for_connections(socket, monitor, n_workers, LAUNCH_SLEEP_TIME)
+
+    for request in iter(requests.get, None):
+        if errors:
+            continue
+
+        try:
+            send_request(socket, request)
+        except Exception as error:
+            errors.append(error)
 
 def Ventilator(
     iterable: Iterable,
@@ -23,6 +68,9 @@ def Ventilator(
     scaffold_port: int,
     on_startup: Optional[Callable]=None,
     on_closure: Optional[Callable]=None,
+    n_workers: Optional[int]=None,
+    transport: str="tcp",
+    ipc_dir: Optional[str]=None,
     **kwargs
 ):
     """
@@ -41,6 +89,11 @@ def Ventilator(
     on scaffold startup.
     - on_closure (Optional[Callable]): An optional callback function to execute
     on scaffold closure.
+    - n_workers (Optional[int]): The number of workers of the first layer,
+    the sending starts as soon as they are all connected if given.
+    - transport (str): The transport of the channels, "tcp" or "ipc".
+    - ipc_dir (Optional[str]): The directory of the socket files of the IPC
+    transport.
     - **kwargs (Any): Additional keyword arguments.
 
     Returns:
@@ -70,6 +123,19 @@ def Ventilator(
     - The Ventilator scaffold creates ZeroMQ sockets for communication, sends
     requests generated from the iterable to the first layer of workers, and
     signals the end of the process when the expected number of tasks is sent.
+    - The Ventilator waits for all the workers to be connected before
+    sending, so that the requests are balanced among them. With `n_workers`
+    the connections are reported by a socket monitor and the wait is bounded
+    by `LAUNCH_SLEEP_TIME` seconds, otherwise the Ventilator waits
+    `LAUNCH_SLEEP_TIME` seconds.
+    The Collator and the Parallel scaffolds wait for their own downstream
+    workers the same way before forwarding.
+    - The PUSH socket has a raised high-water mark and send buffer, so that
+    the requests are queued in bursts instead of blocking the loop as soon as
+    the workers fall behind.
+    - The requests are built in the calling thread and sent from a background
+    thread through a bounded queue, so that building the next requests
+    overlaps with sending the previous ones and with the launch wait.
     """
     if on_startup is not None:
         on_startup()
@@ -78,19 +144,44 @@ def Ventilator(
 
     # Set PUSH binding
     sender = context.socket(zmq.PUSH)
-    sender.bind(f"tcp://127.0.0.1:{push_port}")
+    sender.setsockopt(zmq.SNDHWM, VENTILATOR_SNDHWM)
+    sender.setsockopt(zmq.SNDBUF, VENTILATOR_SNDBUF)
+    monitor = sender.get_monitor_socket(zmq.EVENT_HANDSHAKE_SUCCEEDED) \
+        if n_workers is not None else None
+    sender.bind(get_address(push_port, transport, ipc_dir))
 
     scaffold_sender = context.socket(zmq.PAIR)
-    scaffold_sender.bind(f"tcp://127.0.0.1:{scaffold_port}")
+    scaffold_sender.bind(get_address(scaffold_port, transport, ipc_dir))
+
+    # The PUSH socket is only used by the sending thread
+    requests = Queue(maxsize=VENTILATOR_QUEUE_SIZE)
+    errors = []
+    send_thread = Thread(
+        target=_send_requests,
+        args=(sender, requests, errors, monitor, n_workers)
+    )
+    send_thread.start()
 
-    time.sleep(LAUNCH_SLEEP_TIME)
+    # Bind the keyword arguments once instead of expanding them per element
+    if kwargs:
+        request_fn = partial(request_fn, **kwargs)
 
     n_tasks_counter = 0
-    for el in iterable:
-        send_request(sender, request_fn(el, **kwargs))
-        n_tasks_counter += 1
+    try:
+        for request in map(request_fn, iterable):
+            requests.put(request)
+            n_tasks_counter += 1
+    finally:
+        requests.put(None)
+        send_thread.join()
+
+    if errors:
+        raise errors[0]
+
+    send_expected_n_items(scaffold_sender, n_tasks_counter)
 
-    send_request(scaffold_sender, ExpectedNItems(n_tasks_counter))
+    for port in (push_port, scaffold_port):
+        remove_address(get_address(port, transport, ipc_dir))
 
     if on_closure is not None:
         on_closure()
@@ -1,9 +1,8 @@
-import swisspollentools.schemas.v_0 as v_0
-import swisspollentools.schemas.v_1 as v_1
+from importlib import import_module
+
 import swisspollentools.schemas.v_neptune as v_neptune
 import swisspollentools.schemas.v_jupiter as v_jupiter
 import swisspollentools.schemas.v_basic as v_basic
-import swisspollentools.schemas.v_jupiter_2024 as v_jupiter_2024
 
 import swisspollentools.schemas.sptSchema as sptSchema
 from swisspollentools.utils.schemas import get_auto_caster
@@ -13,3 +12,12 @@ auto_caster = get_auto_caster(
     [v_neptune.eventSchema,v_jupiter.eventSchema, v_basic.eventSchema],
     [v_neptune.spt_translation, v_jupiter.spt_translation, v_basic.spt_translation]
 )
+
+# The schema versions not used by `auto_caster` are imported on first access
+_LAZY_MODULES = ("v_0", "v_1", "v_jupiter_2024")
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        return import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,4 @@
-from swisspollentools.utils import SIPM_DATA_MAX_ITEMS, SchemaDict, NoneType
+from swisspollentools.utils import SIPM_DATA_MAX_ITEMS, SIPM_DATA_KEYS, SchemaDict, NoneType
 
 class holoSchema(SchemaDict):
     keys = ("xy", "zFine", "zRough", "utcImageCapture")
@@ -17,7 +17,7 @@ class sipmDataSchema(SchemaDict):
     dtypes = ((float, NoneType), list, corrChannelsSchema, (float, NoneType), (float, NoneType))
 
 class sipmDataCollectionSchema(SchemaDict):
-    keys = tuple(str(i) for i in range(SIPM_DATA_MAX_ITEMS))
+    keys = SIPM_DATA_KEYS
     dtypes = (sipmDataSchema, ) * SIPM_DATA_MAX_ITEMS
     allow_missing_keys = True
 
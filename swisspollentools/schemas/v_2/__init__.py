@@ -1,4 +1,4 @@
-from datetime import datetime
+from swisspollentools.utils.utils import parse_timestamp
 
 from swisspollentools.utils.schemas import SchemaDict
 from swisspollentools.schemas.v_2.classification_schema import classificationSchema
@@ -11,7 +11,7 @@ class eventSchema(SchemaDict):
     dtypes = ((str, float), str, float, float, bool, rawDataSchema, computedDataSchema, classificationSchema, metaDataSchema, dict)
 
     def __post_init__(self):
-        self["timestamp_dt"] = datetime.strptime(self["timestamp_dt"], "%Y-%m-%d_%H.%M.%S.%f").timestamp()
+        self["timestamp_dt"] = parse_timestamp(self["timestamp_dt"])
 
 spt_translation = {
     "metaData/eventId": "timestamp_dt",
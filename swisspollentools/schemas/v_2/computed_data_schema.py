@@ -37,21 +37,22 @@ class CorrelatorDataSchema(SchemaDict):
     keys = ("average", "magnitude", "phase_shift", "modulation_index", "overflows")
     dtypes = (list, list, list, NoneType, list)
 
-class DarkCurrentCorrectedSchema(SchemaDict):
-    keys = ("average", "magnitude", "phase_shift", "modulation_index", "overflows", "correction_methods")
-    dtypes = (list, list, list, NoneType, list, dict)
-
-class StraylightCorrectedSchema(SchemaDict):
-    keys = ("average", "magnitude", "phase_shift", "modulation_index", "overflows", "correction_methods")
-    dtypes = (list, list, list, list, list, dict)
-
-class PhaseModulationCorrected(SchemaDict):
-    keys = ("average", "magnitude", "phase_shift", "modulation_index", "overflows", "correction_methods")
-    dtypes = (list, list, list, list, list, dict)
-
-class FullyCorrectedSchema(SchemaDict):
-    keys = ("average", "magnitude", "phase_shift", "modulation_index", "overflows", "correction_methods")
-    dtypes = (list, NoneType, list, list, NoneType, dict)
+_CORRECTED_KEYS = ("average", "magnitude", "phase_shift", "modulation_index", "overflows", "correction_methods")
+
+def _corrected_schema(name, none_keys=()):
+    # The corrected fluorescence data schemas only differ by their null fields
+    dtypes = tuple(
+        NoneType if key in none_keys else dict if key == "correction_methods" else list \
+            for key in _CORRECTED_KEYS
+    )
+    return type(name, (SchemaDict,), {
+        "__module__": __name__, "keys": _CORRECTED_KEYS, "dtypes": dtypes
+    })
+
+DarkCurrentCorrectedSchema = _corrected_schema("DarkCurrentCorrectedSchema", ("modulation_index",))
+StraylightCorrectedSchema = _corrected_schema("StraylightCorrectedSchema")
+PhaseModulationCorrected = _corrected_schema("PhaseModulationCorrected")
+FullyCorrectedSchema = _corrected_schema("FullyCorrectedSchema", ("magnitude", "overflows"))
 
 class SpectraSchema(SchemaDict):
     keys = ("method", "formula_tex", "applied_filters", "channel_names", "channel_wavelengths", "excitation_sources", "relative_spectra", "average_mean", "average_std", "average_source_sum")
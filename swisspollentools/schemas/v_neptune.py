@@ -1,5 +1,5 @@
 from swisspollentools.utils.schemas import SchemaDict, SchemaTuple,NoneType
-from datetime import datetime
+from swisspollentools.utils.utils import parse_timestamp
 
 # ## Computed Data Schema
 
@@ -206,7 +206,7 @@ class eventSchema(SchemaDict):
     dtypes = (str, str, float, float, bool, rawDataSchema, computedDataSchema, classificationSchema, metaDataSchema, dict, dict)
 
     def __post_init__(self):
-        self["timestamp_dt"] = datetime.strptime(self["timestamp_dt"], "%Y-%m-%d_%H.%M.%S.%f").timestamp()
+        self["timestamp_dt"] = parse_timestamp(self["timestamp_dt"])
 
 
 #translation dictionary
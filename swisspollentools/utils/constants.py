@@ -21,6 +21,7 @@ Attributes:
     _FILE_PATH_KEY (str): Key for file path (private).
     _BATCH_ID_KEY (str): Key for batch ID (private).
     _N_ITEMS_KEY (str): Key for number of items (private).
+    _END_OF_TASK_KEY (str): Key for end of task flag (private).
     _METADATA_KEY (str): Key for metadata (private).
     _FLUODATA_KEY (str): Key for fluodata (private).
     _REC_PROPERTIES_KEY (str): Key for record properties (private).
@@ -32,6 +33,8 @@ Attributes:
     FILE_PATH_KEY (str): Composite key for file path.
     N_ITEMS_KEY (str): Composite key for number of items.
     BATCH_ID_KEY (str): Composite key for batch ID.
+    END_OF_TASK_KEY (str): Composite key for the flag marking the last
+    response of a task.
     METADATA_KEY (str): Composite key for metadata.
     FLUODATA_KEY (str): Composite key for fluodata.
     REC_PROPERTIES_KEY (str): Composite key for record properties.
@@ -59,7 +62,13 @@ Attributes:
     TRAIN_REQUEST_VALUE (str): Value for train request.
     TRAIN_RESPONSE_VALUE (str): Value for train response.
 
-    LAUNCH_SLEEP_TIME (int): Sleep time for launch.
+    LAUNCH_SLEEP_TIME (int): Time waited by the Ventilator for the workers to
+    connect before sending the requests.
+    VENTILATOR_SNDHWM (int): High-water mark of the Ventilator PUSH socket.
+    VENTILATOR_SNDBUF (int): Kernel send buffer size of the Ventilator PUSH
+    socket, in bytes.
+    VENTILATOR_QUEUE_SIZE (int): Maximum number of requests built by the
+    Ventilator ahead of the sending thread.
 
     POLLENO_EVENT_SUFFIX (str): Suffix for Polleno event data files.
     POLLENO_REC0_SUFFIX (str): Suffix for Polleno record 0 image files.
@@ -70,7 +79,10 @@ Attributes:
 
     SIPM_DATA_MAX_ITEMS (int): Maximum number of iters in SIMP schema 
         definition
+    SIPM_DATA_KEYS (tuple): Keys of the SIPM schema definitions, shared by
+        the schema versions.
 """
+from sys import intern as _intern
 
 EXTRACTION_WORKER_PREFIX = "exw"
 INFERENCE_WORKER_PREFIX = "inw"
@@ -91,6 +103,7 @@ _REQUEST_TYPE_KEY = "request_type"
 _FILE_PATH_KEY = "file_path"
 _BATCH_ID_KEY  = "batch_id"
 _N_ITEMS_KEY = "n_items"
+_END_OF_TASK_KEY = "end_of_task"
 _METADATA_KEY = "metadata"
 _FLUODATA_KEY = "fluodata"
 _REC_PROPERTIES_KEY = "rec_properties"
@@ -98,20 +111,23 @@ _REC_KEY = "rec"
 _PREDICTION_KEY = "prediction"
 _LABEL_KEY = "label"
 
-REQUEST_TYPE_KEY = KEY_SEP.join([HEADER_KEY, _REQUEST_TYPE_KEY])
-FILE_PATH_KEY = KEY_SEP.join([HEADER_KEY, _FILE_PATH_KEY])
-N_ITEMS_KEY = KEY_SEP.join([BODY_KEY, _N_ITEMS_KEY])
-BATCH_ID_KEY = KEY_SEP.join([HEADER_KEY, _BATCH_ID_KEY])
-METADATA_KEY = KEY_SEP.join([BODY_KEY, _METADATA_KEY])
-FLUODATA_KEY = KEY_SEP.join([BODY_KEY, _FLUODATA_KEY])
-REC_PROPERTIES_KEY = KEY_SEP.join([BODY_KEY, _REC_PROPERTIES_KEY])
-REC0_PROPERTIES_KEY = KEY_SEP.join([REC_PROPERTIES_KEY, "0"])
-REC1_PROPERTIES_KEY = KEY_SEP.join([REC_PROPERTIES_KEY, "1"])
-REC_KEY = KEY_SEP.join([BODY_KEY, _REC_KEY])
-REC0_KEY = KEY_SEP.join([REC_KEY, "0"])
-REC1_KEY = KEY_SEP.join([REC_KEY, "1"])
-PREDICTION_KEY = KEY_SEP.join([BODY_KEY, _PREDICTION_KEY])
-LABEL_KEY = KEY_SEP.join([BODY_KEY, _LABEL_KEY])
+# The composite keys are interned, like the keys of the decoded messages,
+# so that the dictionary lookups compare them by identity
+REQUEST_TYPE_KEY = _intern(KEY_SEP.join([HEADER_KEY, _REQUEST_TYPE_KEY]))
+FILE_PATH_KEY = _intern(KEY_SEP.join([HEADER_KEY, _FILE_PATH_KEY]))
+N_ITEMS_KEY = _intern(KEY_SEP.join([BODY_KEY, _N_ITEMS_KEY]))
+BATCH_ID_KEY = _intern(KEY_SEP.join([HEADER_KEY, _BATCH_ID_KEY]))
+END_OF_TASK_KEY = _intern(KEY_SEP.join([HEADER_KEY, _END_OF_TASK_KEY]))
+METADATA_KEY = _intern(KEY_SEP.join([BODY_KEY, _METADATA_KEY]))
+FLUODATA_KEY = _intern(KEY_SEP.join([BODY_KEY, _FLUODATA_KEY]))
+REC_PROPERTIES_KEY = _intern(KEY_SEP.join([BODY_KEY, _REC_PROPERTIES_KEY]))
+REC0_PROPERTIES_KEY = _intern(KEY_SEP.join([REC_PROPERTIES_KEY, "0"]))
+REC1_PROPERTIES_KEY = _intern(KEY_SEP.join([REC_PROPERTIES_KEY, "1"]))
+REC_KEY = _intern(KEY_SEP.join([BODY_KEY, _REC_KEY]))
+REC0_KEY = _intern(KEY_SEP.join([REC_KEY, "0"]))
+REC1_KEY = _intern(KEY_SEP.join([REC_KEY, "1"]))
+PREDICTION_KEY = _intern(KEY_SEP.join([BODY_KEY, _PREDICTION_KEY]))
+LABEL_KEY = _intern(KEY_SEP.join([BODY_KEY, _LABEL_KEY]))
 
 END_OF_TASK_VALUE = "EndOfTask"
 END_OF_PROCESS_VALUE = "EndOfProcess"
@@ -130,6 +146,9 @@ TRAIN_REQUEST_VALUE = "TrainRequest"
 TRAIN_RESPONSE_VALUE = "TrainResponse"
 
 LAUNCH_SLEEP_TIME=5
+VENTILATOR_SNDHWM=1 << 16
+VENTILATOR_SNDBUF=4 * 1024 * 1024
+VENTILATOR_QUEUE_SIZE=64
 
 VALID_POLENO_EVENT_SUFFIX = [
     "_event.json",
@@ -151,4 +170,5 @@ _NP_ARRAY_DATA_KEYS = (
 )
 NP_ARRAY_DATA_KEYS = (FLUODATA_KEY, REC_KEY, PREDICTION_KEY)
 
-SIPM_DATA_MAX_ITEMS = 50
\ No newline at end of file
+SIPM_DATA_MAX_ITEMS = 50
+SIPM_DATA_KEYS = tuple(str(i) for i in range(SIPM_DATA_MAX_ITEMS))
@@ -19,7 +19,7 @@ def ismsg(msg: dict) -> bool:
     if not isinstance(msg, dict):
         raise ValueError("Calling `ismsg` on non-dictionnary object.")
 
-    return REQUEST_TYPE_KEY in msg.keys()
+    return REQUEST_TYPE_KEY in msg
 
 def assert_ismsg(func: Callable) -> bool:
     """
@@ -46,6 +46,11 @@ def assert_ismsg(func: Callable) -> bool:
     
     return wrapper
 
+def _not_a_message(name: str) -> ValueError:
+    # The message predicates are called on every received message, they look
+    # the request type up directly rather than through `assert_ismsg`
+    return ValueError(f"Calling `{name}` on non-message dictionnary")
+
 def EndOfTask() -> dict:
     """
     Create a message signaling the completion of a task.
@@ -64,15 +69,40 @@ def EOT() -> dict:
     """
     return EndOfTask()
 
-@assert_ismsg
 def iseot(msg: dict) -> bool:
     """
     Check if the message represents an EndOfTask signal.
 
     Parameters:
     - msg (dict): The message dictionary to be checked.
+
+    Raises:
+    - ValueError: If called on a non-message object.
+    """
+    try:
+        return msg[REQUEST_TYPE_KEY] == END_OF_TASK_VALUE
+    except (KeyError, TypeError):
+        raise _not_a_message("iseot") from None
+
+def haseot(msg: dict) -> bool:
+    """
+    Check if the message closes a task, either as an EndOfTask signal or as
+    the last response of the task, flagged with `END_OF_TASK_KEY`.
+
+    Parameters:
+    - msg (dict): The message dictionary to be checked.
+
+    Returns:
+    bool: True if the message closes a task, False otherwise.
+
+    Raises:
+    - ValueError: If called on a non-message object.
     """
-    return msg[REQUEST_TYPE_KEY] == END_OF_TASK_VALUE
+    try:
+        return msg[REQUEST_TYPE_KEY] == END_OF_TASK_VALUE or \
+            END_OF_TASK_KEY in msg
+    except (KeyError, TypeError):
+        raise _not_a_message("haseot") from None
 
 def EndOfProcess() -> dict:
     """
@@ -92,7 +122,6 @@ def EOP() -> dict:
     """
     return EndOfProcess()
 
-@assert_ismsg
 def iseop(msg: dict) -> bool:
     """
     Check if the message represents an EndOfProcess signal.
@@ -102,8 +131,14 @@ def iseop(msg: dict) -> bool:
 
     Returns:
     bool: True if the message is an EndOfProcess message, False otherwise.
+
+    Raises:
+    - ValueError: If called on a non-message object.
     """
-    return msg[REQUEST_TYPE_KEY] == END_OF_PROCESS_VALUE
+    try:
+        return msg[REQUEST_TYPE_KEY] == END_OF_PROCESS_VALUE
+    except (KeyError, TypeError):
+        raise _not_a_message("iseop") from None
 
 def ExpectedNItems(n_items: int):
     """
@@ -126,7 +161,6 @@ def ExNIt(*args, **kwargs):
     """
     return ExpectedNItems(*args, **kwargs)
 
-@assert_ismsg
 def isexnit(msg: dict):
     """
     Check if the message is an ExpectedNItems message.
@@ -136,8 +170,14 @@ def isexnit(msg: dict):
 
     Returns:
     bool: True if the message is an ExpectedNItems message, False otherwise.
+
+    Raises:
+    - ValueError: If called on a non-message object.
     """
-    return msg[REQUEST_TYPE_KEY] == EXPECTED_N_ITEMS_VALUE
+    try:
+        return msg[REQUEST_TYPE_KEY] == EXPECTED_N_ITEMS_VALUE
+    except (KeyError, TypeError):
+        raise _not_a_message("isexnit") from None
 
 @assert_ismsg
 def get_header(msg: Dict) -> Dict:
@@ -4,24 +4,75 @@ Request functions for communication using ZeroMQ.
 This module provides functions for sending and receiving requests using ZeroMQ
 (ZMQ). The `send_request` function is used to send a request with optional
 NumPy array data, while the `recv_request` function is used to receive and
-reconstruct the request.
+reconstruct the request. The non-array part of the request and the array
+metadata are serialized with MessagePack.
 
 Functions:
-- send_request(socket: zmq.Socket, request: Dict, copy: bool=True, track: 
+- send_request(socket: zmq.Socket, request: Dict, copy: bool=False, track: 
 bool=False) -> None: Send a request using a ZeroMQ socket.
-- recv_request(socket: zmq.Socket, copy: bool=True, track: bool=False) -> Dict:
-Receive and reconstruct a request using a ZeroMQ socket.
+- recv_request(socket: zmq.Socket, copy: bool=False, track: bool=False,
+flags: int=0) -> Dict: Receive and reconstruct a request using a ZeroMQ
+socket.
+- recv_request_header(socket: zmq.Socket) -> Dict: Receive a request using a
+ZeroMQ socket and reconstruct only its non-array part.
+- send_end_of_task(socket: zmq.Socket) -> None: Send an EndOfTask message.
+- send_end_of_process(socket: zmq.Socket) -> None: Send an EndOfProcess
+message.
+- send_expected_n_items(socket: zmq.Socket, n_items: int) -> None: Send an
+ExpectedNItems message.
+- get_address(port: int, transport: str, ipc_dir: Optional[str]) -> str: Get
+the address of a channel between the scaffolds and the workers.
+- remove_address(address: str) -> None: Remove the socket file of a bound
+IPC address.
+- wait_for_connections(socket: zmq.Socket, monitor: zmq.Socket,
+n_connections: int, timeout: float) -> int: Wait until a number of peers are
+connected to a bound socket.
 """
 
-from typing import Dict
+import os
+import time
+from threading import local
+from typing import Dict, Optional
 
 import zmq
+import msgpack
+from zmq.utils.monitor import recv_monitor_message
 import numpy as np
 
+from swisspollentools.utils.messages import \
+    EndOfTask, EndOfProcess, ExpectedNItems
+
+class _PackerLocal(local):
+    """
+    Thread-local MessagePack packer, reused across the sent requests instead
+    of creating a new packer and its buffer for every `msgpack.packb` call.
+    """
+    def __init__(self):
+        self.packer = msgpack.Packer()
+
+_PACKER_LOCAL = _PackerLocal()
+
+# Serialized EndOfTask header, compared byte-wise to skip its deserialization
+_END_OF_TASK_HEADER = msgpack.packb(EndOfTask())
+
+# Serialized frames of the constant control messages, built once at import
+_EMPTY_METADATA = msgpack.packb({})
+_END_OF_TASK_FRAMES = [_END_OF_TASK_HEADER, _EMPTY_METADATA]
+_END_OF_PROCESS_FRAMES = [msgpack.packb(EndOfProcess()), _EMPTY_METADATA]
+
+# Serialized ExpectedNItems header up to its `n_items` value, cut from a
+# serialized template so that it follows the keys of the message
+_EXPECTED_N_ITEMS_PREFIX = msgpack.packb(ExpectedNItems(None))[:-1]
+if not _EXPECTED_N_ITEMS_PREFIX + msgpack.packb(2 ** 40) == \
+    msgpack.packb(ExpectedNItems(2 ** 40)):
+    raise RuntimeError(
+        "The `n_items` value must end the ExpectedNItems message."
+    )
+
 def send_request(
     socket:zmq.Socket,
     request: Dict,
-    copy: bool=True,
+    copy: bool=False,
     track: bool=False
 ):
     """
@@ -31,7 +82,7 @@ def send_request(
     - socket (zmq.Socket): ZeroMQ socket for communication.
     - request (Dict): The request to be sent.
     - copy (bool, optional): Whether to copy the NumPy array data (default is
-    True).
+    False).
     - track (bool, optional): Whether to track the NumPy array data (default is
     False).
 
@@ -51,38 +102,43 @@ def send_request(
     send_request(socket, request_data)
 
     Note:
-    - The function handles the transmission of both JSON data and NumPy array
-    data through the ZeroMQ socket, allowing communication of complex requests.
-    """
-    md = {k: (str(v.dtype), v.shape) \
-            for k, v in request.items() \
-            if isinstance(v, np.ndarray)}
-    
-    if not md:
-        socket.send_json(
-            {k: v for k, v in request.items() \
-                if not isinstance(v, np.ndarray)},
-            zmq.SNDMORE
-        )
-        socket.send_json({})
-        return
-    
-    socket.send_json(
-        {k: v for k, v in request.items() \
-            if not isinstance(v, np.ndarray)},
-        zmq.SNDMORE
-    )
-    socket.send_json(md, zmq.SNDMORE)
-    for i in range(len(md) - 1):
-        key = list(md.keys())[i]
-        socket.send(request[key], zmq.SNDMORE, copy=copy, track=track)
-    key = list(md.keys())[-1]
-    socket.send(request[key])
+    - The function handles the transmission of both MessagePack data and NumPy
+    array data through the ZeroMQ socket, allowing communication of complex
+    requests.
+    - By default the NumPy arrays are sent without copy, they must not be
+    modified until the request is sent. Only the arrays that are not
+    C-contiguous, such as transposed arrays or strided slices, are copied.
+    """
+    pack = _PACKER_LOCAL.packer.pack
+
+    # The request is partitioned in a single pass
+    header, arrays = {}, {}
+    for k, v in request.items():
+        if isinstance(v, np.ndarray):
+            arrays[k] = v
+        else:
+            header[k] = v
+
+    # The array-protocol type string of the dtype is a plain attribute, unlike
+    # `str(dtype)` which formats the name of the dtype on every call
+    md = {k: (v.dtype.str, v.shape) for k, v in arrays.items()}
+
+    # All the frames of a request are handed to ZeroMQ in a single call
+    # The frames are read in C order by `recv_request`, the arrays in
+    # another layout are copied to a C-contiguous buffer first
+    frames = [
+        pack(header),
+        pack(md),
+        *(v if v.flags.c_contiguous else np.ascontiguousarray(v) \
+            for v in arrays.values())
+    ]
+    socket.send_multipart(frames, copy=copy, track=track)
 
 def recv_request(
     socket: zmq.Socket,
-    copy: bool=True,
-    track: bool=False
+    copy: bool=False,
+    track: bool=False,
+    flags: int=0
 ) -> Dict:
     """
     Receive and reconstruct a request using a ZeroMQ socket.
@@ -90,9 +146,12 @@ def recv_request(
     Parameters:
     - socket (zmq.Socket): ZeroMQ socket for communication.
     - copy (bool, optional): Whether to copy the NumPy array data (default is
-    True).
+    False).
     - track (bool, optional): Whether to track the NumPy array data (default is
     False).
+    - flags (int, optional): ZeroMQ flags of the reception of the first frame,
+    e.g. zmq.NOBLOCK to raise zmq.Again when no request is queued (default is
+    0).
 
     Returns:
     Dict: The reconstructed request.
@@ -109,16 +168,207 @@ def recv_request(
     print(received_request)
 
     Note:
-    - The function receives both JSON data and NumPy array data from the ZeroMQ
-    socket and reconstructs the original request, allowing the handling of 
-    complex requests.
+    - The function receives both MessagePack data and NumPy array data from the
+    ZeroMQ socket and reconstructs the original request, allowing the handling
+    of complex requests.
+    - By default the NumPy arrays are views on the received ZeroMQ frames, no
+    copy of the data is made.
     """
-    request = socket.recv_json()
-    md = socket.recv_json()
+    # The frames of a multipart message are delivered at once, only the
+    # reception of the first one can block
+    request = msgpack.unpackb(socket.recv(flags), strict_map_key=False)
+    md = msgpack.unpackb(socket.recv())
 
     for key, (dtype, shape) in md.items():
         array = socket.recv(copy=copy, track=track)
-        array = np.frombuffer(memoryview(array), dtype=dtype).reshape(shape)
+        array = np.frombuffer(array, dtype=dtype).reshape(shape)
         request[key] = array
 
     return request
+
+def recv_request_header(
+    socket: zmq.Socket
+) -> Dict:
+    """
+    Receive a request using a ZeroMQ socket and reconstruct only its non-array
+    part.
+
+    Parameters:
+    - socket (zmq.Socket): ZeroMQ socket for communication.
+
+    Returns:
+    Dict: The non-array part of the request.
+
+    Note:
+    - The function is meant for the consumers that only need the request type
+    of the messages, such as the Sink. The NumPy array frames are received
+    without copy and discarded, and the EndOfTask messages are recognized from
+    their serialized bytes without being deserialized.
+    """
+    header = socket.recv_multipart(copy=False)[0].bytes
+
+    if header == _END_OF_TASK_HEADER:
+        return EndOfTask()
+
+    return msgpack.unpackb(header, strict_map_key=False)
+
+def send_end_of_task(
+    socket: zmq.Socket
+):
+    """
+    Send an EndOfTask message using a ZeroMQ socket.
+
+    Parameters:
+    - socket (zmq.Socket): ZeroMQ socket for communication.
+
+    Returns:
+    None
+
+    Note:
+    - The message is sent from frames serialized once at import, it is
+    received as `send_request(socket, EndOfTask())` would be.
+    """
+    socket.send_multipart(_END_OF_TASK_FRAMES)
+
+def send_end_of_process(
+    socket: zmq.Socket
+):
+    """
+    Send an EndOfProcess message using a ZeroMQ socket.
+
+    Parameters:
+    - socket (zmq.Socket): ZeroMQ socket for communication.
+
+    Returns:
+    None
+
+    Note:
+    - The message is sent from frames serialized once at import, it is
+    received as `send_request(socket, EndOfProcess())` would be.
+    """
+    socket.send_multipart(_END_OF_PROCESS_FRAMES)
+
+def send_expected_n_items(
+    socket: zmq.Socket,
+    n_items: int
+):
+    """
+    Send an ExpectedNItems message using a ZeroMQ socket.
+
+    Parameters:
+    - socket (zmq.Socket): ZeroMQ socket for communication.
+    - n_items (int): The number of items to forward.
+
+    Returns:
+    None
+
+    Note:
+    - Only the number of items is serialized, the rest of the header is
+    serialized once at import. The message is received as
+    `send_request(socket, ExpectedNItems(n_items))` would be.
+    """
+    socket.send_multipart([
+        _EXPECTED_N_ITEMS_PREFIX + _PACKER_LOCAL.packer.pack(n_items),
+        _EMPTY_METADATA
+    ])
+
+def get_address(
+    port: int,
+    transport: str="tcp",
+    ipc_dir: Optional[str]=None
+) -> str:
+    """
+    Get the address of a channel between the scaffolds and the workers, all
+    running on the same host.
+
+    Parameters:
+    - port (int): Port identifying the channel.
+    - transport (str): The transport of the channel, either "tcp" for loopback
+    TCP on the port or "ipc" for a UNIX domain socket named after the port.
+    - ipc_dir (Optional[str]): The directory of the socket files, required by
+    the IPC transport.
+
+    Returns:
+    str: The address to bind or connect the sockets of the channel to.
+
+    Note:
+    - The IPC transport avoids the loopback TCP stack. Binding an IPC address
+    already bound replaces the previous socket file instead of failing, the
+    directory should therefore be unique to the pipeline run, e.g. created by
+    `tempfile.mkdtemp`.
+    - The socket files are left in place by the processes exiting without
+    closing their sockets, see `remove_address`.
+    """
+    if transport == "tcp":
+        return f"tcp://127.0.0.1:{port}"
+
+    if transport == "ipc":
+        if ipc_dir is None:
+            raise ValueError("The IPC transport requires an `ipc_dir`.")
+
+        return f"ipc://{os.path.join(ipc_dir, str(port))}"
+
+    raise ValueError(f"Unknown transport: {transport}")
+
+def remove_address(address: str) -> None:
+    """
+    Remove the socket file of a bound IPC address.
+
+    Parameters:
+    - address (str): The address, as returned by `get_address`.
+
+    Returns:
+    None
+
+    Note:
+    - Nothing is done for the other transports or if the file was already
+    removed. The connections already established are kept.
+    """
+    if address.startswith("ipc://"):
+        try:
+            os.unlink(address[len("ipc://"):])
+        except FileNotFoundError:
+            pass
+
+def wait_for_connections(
+    socket: zmq.Socket,
+    monitor: zmq.Socket,
+    n_connections: int,
+    timeout: float
+) -> int:
+    """
+    Wait until a number of peers are connected to a bound socket.
+
+    Parameters:
+    - socket (zmq.Socket): The bound socket the peers connect to.
+    - monitor (zmq.Socket): Monitor socket of `socket`, reporting the
+    successful handshakes, as returned by
+    `socket.get_monitor_socket(zmq.EVENT_HANDSHAKE_SUCCEEDED)`.
+    - n_connections (int): The number of peers to wait for.
+    - timeout (float): The maximum waiting time, in seconds.
+
+    Returns:
+    int: The number of peers connected before the end of the wait.
+
+    Note:
+    - The monitor must be set before the binding of the socket, so that no
+    connection is missed. It is disabled and closed at the end of the wait.
+    - A PUSH socket only balances its messages among the peers connected
+    when they are sent, waiting for all of them keeps the first one from
+    receiving all the first messages.
+    """
+    deadline = time.monotonic() + timeout
+    n_connected = 0
+    while n_connected < n_connections and \
+        (remaining := deadline - time.monotonic()) > 0:
+        if not monitor.poll(remaining * 1000):
+            break
+
+        event = recv_monitor_message(monitor)
+        if event["event"] == zmq.EVENT_HANDSHAKE_SUCCEEDED:
+            n_connected += 1
+
+    socket.disable_monitor()
+    monitor.close()
+
+    return n_connected
@@ -1,15 +1,44 @@
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
 from collections.abc import MutableMapping
-from typing import Dict
+from itertools import count
+from typing import Dict, List, Sequence
+
+import numpy as np
 
 from swisspollentools.utils.constants import KEY_SEP
 from swisspollentools.utils.utils import flatten_dictionary
 
 NoneType = type(None)
 
-class Schema(ABC):
+class _SchemaMeta(ABCMeta):
+    """
+    Metaclass giving every schema class empty `__slots__` unless it defines
+    its own, so that the instances only hold their `__schema__` container and
+    no per-instance `__dict__`.
+    """
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        namespace.setdefault("__slots__", ())
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+class Schema(ABC, metaclass=_SchemaMeta):
+    __slots__ = ("__schema__",)
+
     dtypes = tuple()
     defaults = []
+    # The keys and items are constant per class, cached by `__init_subclass__`
+    __attr_keys_cache__ = tuple()
+    __attr_items_cache__ = tuple()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Whether each dtype is a nested schema, resolved once per class
+        # rather than for every validated event
+        cls.__nested_dtypes__ = tuple(
+            not isinstance(dtype, tuple) and issubclass(dtype, Schema) \
+                for dtype in cls.dtypes
+        )
+        cls.__build__ = staticmethod(_lazy_build(cls))
 
     @abstractmethod
     def __init__(self, schema, validate, allow_defaults):
@@ -66,27 +95,283 @@ class Schema(ABC):
     def empty(cls):
         pass
 
+    @classmethod
+    def resolve_key(cls, key):
+        """
+        Resolve a composite key into the keys indexing the nested `__schema__`
+        containers, using the class definitions. Returns None when the key
+        goes through a field that is not a nested schema.
+        """
+        path = []
+        dtype = cls
+        for k in key.split(KEY_SEP):
+            if not (isinstance(dtype, type) and issubclass(dtype, Schema)):
+                return None
+
+            if issubclass(dtype, SchemaTuple):
+                if not k.isdigit() or int(k) >= len(dtype.dtypes):
+                    return None
+                k = int(k)
+                dtype = dtype.dtypes[k]
+            else:
+                dtype = dtype.__dtypes_dict__.get(k)
+
+            path.append(k)
+
+        return tuple(path)
+
     @classmethod
     def get_caster(cls, other, translation):
         translation = flatten_dictionary(translation, separator=KEY_SEP)
+        # The composite keys are resolved once, rather than split on every
+        # casted event
+        translation = [
+            (other_key, other.resolve_key(other_key), key, cls.resolve_key(key)) \
+                for other_key, key in translation.items()
+        ]
+
+        cast = _compile_cast(translation)
 
         def caster(schema):
             if not isinstance(schema, cls):
                 raise ValueError()
             
             other_schema = other.empty()
-            for other_key, key in translation.items():
-                other_schema[other_key] = schema[key]
+            try:
+                cast(schema, other_schema)
+            except Exception:
+                # The compiled copy assumes that every resolved path goes
+                # through nested schemas, otherwise the generic copy is used
+                other_schema = other.empty()
+                for other_key, other_path, key, path in translation:
+                    _set_at_path(
+                        other_schema, other_key, other_path,
+                        _get_at_path(schema, key, path)
+                    )
             return other_schema
         
         return caster
 
+def _compile_cast(translation):
+    """
+    Generate and compile a function copying the translated values from a
+    schema to another, with one statement per translated key. The nested
+    containers shared by several keys are bound to local variables once.
+    """
+    lines = ["def cast(schema, other_schema):"]
+    containers = {}
+
+    def access(name, path, bind):
+        expression = name
+        for i, k in enumerate(path[:-1]):
+            if not bind:
+                expression += f".__schema__[{k!r}]"
+                continue
+
+            prefix = (name, *path[:i + 1])
+            if prefix not in containers:
+                containers[prefix] = f"container_{len(containers)}"
+                lines.append(
+                    f"    {containers[prefix]} = {expression}.__schema__[{k!r}]"
+                )
+            expression = containers[prefix]
+
+        return f"{expression}.__schema__[{path[-1]!r}]"
+
+    # The target containers can only be bound when no translated key replaces
+    # a container written by another key
+    other_paths = [t[1] for t in translation if t[1] is not None]
+    bind_other = not any(
+        p[:len(q)] == q for p in other_paths for q in other_paths \
+            if len(q) < len(p)
+    )
+
+    for other_key, other_path, key, path in translation:
+        value = access("schema", path, True) if path is not None \
+            else f"schema[{key!r}]"
+        target = access("other_schema", other_path, bind_other) \
+            if other_path is not None else f"other_schema[{other_key!r}]"
+        lines.append(f"    {target} = {value}")
+    lines.append("    return other_schema")
+
+    namespace = {}
+    exec(compile("\n".join(lines), "<schema caster>", "exec"), namespace)
+    return namespace["cast"]
+
+def _get_at_path(schema, key, path):
+    """
+    Get the value of a composite key from its resolved path, falling back to
+    the composite key when the path goes through a non-schema value.
+    """
+    if path is None:
+        return schema[key]
+
+    value = schema
+    for k in path:
+        if not isinstance(value, Schema):
+            return schema[key]
+        value = value.__schema__[k]
+
+    return value
+
+def _set_at_path(schema, key, path, value):
+    """
+    Set the value of a composite key from its resolved path, falling back to
+    the composite key when the path goes through a non-schema value.
+    """
+    if path is None:
+        schema[key] = value
+        return
+
+    parent = schema
+    for k in path[:-1]:
+        if not isinstance(parent, Schema):
+            break
+        parent = parent.__schema__[k]
+
+    if not isinstance(parent, Schema):
+        schema[key] = value
+        return
+
+    parent.__schema__[path[-1]] = value
+
+# Builtin dtypes checked by exact type in the compiled fit checks
+_EXACT_DTYPES = frozenset((int, float, str, bool, list, dict, NoneType))
+
+def _compile_fit(cls):
+    """
+    Generate and compile a function checking that a dictionary fits a
+    SchemaDict class, with the checks of the nested SchemaDict classes
+    inlined into a single expression. The function only returns True when
+    `fit` would, any other case is left to the generic `fit`.
+    """
+    namespace = {}
+    names = count()
+
+    def expression(dtype, schema, value):
+        # `schema` is evaluated once, `value` then refers to its result
+        i = next(names)
+        namespace[f"keys_{i}"] = dtype.__keys_set__
+        keys_check = "<=" if dtype.allow_missing_keys else "=="
+        checks = [
+            f"{schema}.__class__ is dict",
+            f"{value}.keys() {keys_check} keys_{i}",
+        ]
+        for key, field_dtype, nested in dtype.__nested_items__:
+            j = next(names)
+            namespace[f"dtype_{j}"] = field_dtype
+            field = f"{value}[{key!r}]"
+            if nested and issubclass(field_dtype, SchemaDict):
+                # The fit of the nested SchemaDict only runs when the
+                # inlined check does not succeed
+                check = f"({expression(field_dtype, f'(value_{j} := {field})', f'value_{j}')} " \
+                    f"or dtype_{j}.fit(value_{j}, allow_defaults))"
+            elif nested:
+                check = f"dtype_{j}.fit({field}, allow_defaults)"
+            elif field_dtype in _EXACT_DTYPES:
+                # The parsed JSON values are never instances of subclasses of
+                # the builtin types, the other values go through the generic fit
+                check = f"{field}.__class__ is dtype_{j}"
+            else:
+                check = f"isinstance({field}, dtype_{j})"
+            if dtype.allow_missing_keys:
+                check = f"({key!r} not in {value} or {check})"
+            checks.append(check)
+        return "(" + " and ".join(checks) + ")"
+
+    source = "def fit(schema, allow_defaults):\n" \
+        f"    return {expression(cls, 'schema', 'schema')}"
+    exec(compile(source, f"<{cls.__name__} fit>", "exec"), namespace)
+    return namespace["fit"]
+
+def _lazy_compiled_fit(cls):
+    """
+    Return a function compiling the fit check of a SchemaDict class on its
+    first call, only the classes whose `fit` is called are compiled.
+    """
+    def compiled_fit(schema, allow_defaults):
+        cls.__compiled_fit__ = staticmethod(_compile_fit(cls))
+        return cls.__compiled_fit__(schema, allow_defaults)
+
+    return compiled_fit
+
+def _compile_build(cls):
+    """
+    Generate and compile a function building a schema instance from a value
+    that fits the class, without checking the fields again. The values that
+    are not a dictionary with the keys of the class, or a list with the length
+    of the class, are built by the class constructor.
+    """
+    namespace = {"cls": cls, "new": object.__new__}
+    if issubclass(cls, SchemaDict):
+        namespace["keys_set"] = cls.__keys_set__
+        guard = "schema.__class__ is not dict or schema.keys() != keys_set"
+        keys = cls.keys
+        opening, closing = "{", "}"
+    else:
+        guard = f"schema.__class__ is not list or len(schema) != {len(cls.dtypes)}"
+        keys = range(len(cls.dtypes))
+        opening, closing = "[", "]"
+
+    fields = []
+    for i, (key, dtype, nested) in enumerate(
+        zip(keys, cls.dtypes, cls.__nested_dtypes__)
+    ):
+        value = f"schema[{key!r}]"
+        if nested:
+            namespace[f"dtype_{i}"] = dtype
+            value = f"dtype_{i}.__build__({value})"
+        fields.append(f"{key!r}: {value}" if opening == "{" else value)
+
+    lines = [
+        "def build(schema):",
+        f"    if {guard}:",
+        "        return cls(schema, True, True)",
+        "    self = new(cls)",
+        f"    self.__schema__ = {opening}{', '.join(fields)}{closing}",
+        "    self.__post_init__()",
+        "    return self",
+    ]
+    exec(compile("\n".join(lines), f"<{cls.__name__} build>", "exec"), namespace)
+    return namespace["build"]
+
+def _lazy_build(cls):
+    """
+    Return a function compiling the build function of a schema class on its
+    first call. The classes that define their own constructor or non-empty
+    defaults are always built by their constructor.
+    """
+    def build(schema):
+        if cls.__init__ not in (SchemaDict.__init__, SchemaTuple.__init__) \
+            or any(isinstance(default, (dict, list)) and default \
+                       for default in cls.defaults):
+            compiled = lambda schema: cls(schema, True, True)
+        else:
+            compiled = _compile_build(cls)
+        cls.__build__ = staticmethod(compiled)
+        return cls.__build__(schema)
+
+    return build
+
 class SchemaDict(Schema):
     keys = tuple()
     defaults = [{}, None]
     allow_undefined_keys=False,
     allow_missing_keys=False,
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        cls.__keys_set__ = frozenset(cls.keys)
+        cls.__dtypes_dict__ = dict(zip(cls.keys, cls.dtypes))
+        cls.__nested_dict__ = dict(zip(cls.keys, cls.__nested_dtypes__))
+        cls.__nested_items__ = tuple(
+            zip(cls.keys, cls.dtypes, cls.__nested_dtypes__)
+        )
+        cls.__attr_keys_cache__ = tuple(cls.keys)
+        cls.__attr_items_cache__ = tuple(zip(cls.keys, cls.dtypes))
+        cls.__compiled_fit__ = staticmethod(_lazy_compiled_fit(cls))
+
     def __init__(
         self,
         schema: dict,
@@ -101,24 +386,28 @@ class SchemaDict(Schema):
             self.__schema__ = schema
             return
         
-        undefined_keys = list(set(schema.keys()).difference(set(self.__attr_keys__())))
+        # The key differences are computed on the dict view against the
+        # class frozenset, they are only listed for the error messages
+        undefined_keys = schema.keys() - self.__keys_set__
         if undefined_keys and self.allow_undefined_keys:
-            raise ValueError(f"Undefined keys were found in the schema: {undefined_keys}")
+            raise ValueError(f"Undefined keys were found in the schema: {list(undefined_keys)}")
 
-        missing_keys = list(set(self.__attr_keys__()).difference(set(schema.keys())))
+        missing_keys = self.__keys_set__ - schema.keys()
         if missing_keys and not self.allow_missing_keys:
-            raise ValueError(f"Missing keys were not found in the schema: {missing_keys}")
-
-        self.__schema__ = {}
-        for key, value in self.__attr_items__():
-            if self.allow_missing_keys and key not in schema.keys():
-                if not isinstance(value, tuple) and issubclass(value, Schema):
-                    self[key] = value.empty()
-                self[key] = None
+            raise ValueError(f"Missing keys were not found in the schema: {list(missing_keys)}")
+
+        # The keys are plain field names, the values are stored directly
+        # rather than through the composite key parsing of `__setitem__`
+        self.__schema__ = fields = {}
+        for key, value, nested in self.__nested_items__:
+            if self.allow_missing_keys and key not in schema:
+                if nested:
+                    fields[key] = value.empty()
+                fields[key] = None
                 continue
 
-            if not isinstance(value, tuple) and issubclass(value, Schema):
-                self[key] = value(
+            if nested:
+                fields[key] = value(
                     schema=schema[key],
                     validate=validate,
                     allow_defaults=allow_defaults
@@ -128,26 +417,25 @@ class SchemaDict(Schema):
             if not isinstance(schema[key], value):
                 raise ValueError(f"ValueError: key {key} expected {value}, got type {type(schema[key])}")
 
-            self[key] = schema[key]
+            fields[key] = schema[key]
 
         self.__post_init__()
 
     def __getitem__(self, key):
-        key = key.split(KEY_SEP, maxsplit=1)
-
-        if len(key) == 2:
-            return self[key[0]][key[1]]
+        # Plain field names are the common case, looked up without splitting
+        if KEY_SEP not in key:
+            return self.__schema__[key]
 
-        return self.__schema__[key[0]]
+        head, tail = key.split(KEY_SEP, maxsplit=1)
+        return self.__schema__[head][tail]
 
     def __setitem__(self, key, value):
-        key = key.split(KEY_SEP, maxsplit=1)
-
-        if len(key) == 2:
-            self[key[0]][key[1]] = value
+        if KEY_SEP not in key:
+            self.__schema__[key] = value
             return
 
-        self.__schema__[key[0]] = value
+        head, tail = key.split(KEY_SEP, maxsplit=1)
+        self.__schema__[head][tail] = value
 
     @property
     def schema(self):
@@ -159,33 +447,41 @@ class SchemaDict(Schema):
 
     @classmethod
     def __attr_keys__(cls):
-        return list(cls.keys)
+        return cls.__attr_keys_cache__
     
     @classmethod
     def __attr_items__(cls):
-        return list(zip(cls.keys, cls.dtypes))
+        return cls.__attr_items_cache__
 
     @classmethod
     def fit(cls, schema: dict, allow_defaults=True):
+        # The compiled check covers the fitting schemas, the other cases go
+        # through the generic check to keep its exact outcome
+        try:
+            if cls.__compiled_fit__(schema, allow_defaults):
+                return True
+        except Exception:
+            pass
+
         if schema in cls.defaults and allow_defaults:
             return True
 
-        undefined_keys = list(set(schema.keys()).difference(set(cls.__attr_keys__())))
+        undefined_keys = schema.keys() - cls.__keys_set__
         if undefined_keys and cls.allow_undefined_keys:
             return False
 
-        missing_keys = list(set(cls.__attr_keys__()).difference(set(schema.keys())))
+        missing_keys = cls.__keys_set__ - schema.keys()
         if missing_keys and not cls.allow_missing_keys:
             return False
         
-        dtypes_dict = dict(cls.__attr_items__())
+        dtypes_dict = cls.__dtypes_dict__
         for key, value in schema.items():
             if key not in dtypes_dict and cls.allow_undefined_keys:
                 continue
 
             dtype = dtypes_dict[key]
 
-            if not isinstance(dtype, tuple) and issubclass(dtype, Schema):
+            if cls.__nested_dict__[key]:
                 if not dtype.fit(value, allow_defaults=allow_defaults):
                     return False
 
@@ -198,8 +494,8 @@ class SchemaDict(Schema):
     @classmethod
     def empty(cls):
         empty = {}
-        for key, dtype in cls.__attr_items__():
-            if not isinstance(dtype, tuple) and issubclass(dtype, Schema):
+        for key, dtype, nested in cls.__nested_items__:
+            if nested:
                 empty[key] = dtype.empty()
                 continue
 
@@ -209,6 +505,12 @@ class SchemaDict(Schema):
         return empty
 
 class SchemaTuple(Schema):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        cls.__attr_keys_cache__ = tuple(range(len(cls.dtypes)))
+        cls.__attr_items_cache__ = tuple(enumerate(cls.dtypes))
+
     def __init__(self, schema: list, validate=True, allow_defaults=False):
         if not validate:
             self.__schema__ = list(schema)
@@ -221,48 +523,49 @@ class SchemaTuple(Schema):
         if not len(self.dtypes) == len(schema):
             raise ValueError()
 
-        self.__schema__ = list(None for _ in self.__attr_keys__())
-        for key, value in self.__attr_items__():
-            if not isinstance(value, tuple) and issubclass(value, Schema):
-                self[key] = value(schema=schema[key], validate=validate, allow_defaults=allow_defaults)
+        self.__schema__ = fields = [None] * len(self.dtypes)
+        for key, (value, nested) in enumerate(
+            zip(self.dtypes, self.__nested_dtypes__)
+        ):
+            if nested:
+                fields[key] = value(schema=schema[key], validate=validate, allow_defaults=allow_defaults)
                 continue
 
             if not isinstance(schema[key], value):
                 raise ValueError()
             
-            self[key] = schema[key]
+            fields[key] = schema[key]
 
         self.__post_init__()
 
     def __getitem__(self, key):
-        if isinstance(key, str):
-            key = key.split(KEY_SEP, maxsplit=1)
-
-            if len(key) == 2:
-                return self[int(key[0])][key[1]]
-            
-            return self[int(key[0])]
+        # Positional indices are the common case, checked first
+        if isinstance(key, int):
+            return self.__schema__[key]
 
-        if not isinstance(key, int):
+        if not isinstance(key, str):
             raise ValueError()
 
-        return self.__schema__[key]
+        if KEY_SEP not in key:
+            return self.__schema__[int(key)]
+
+        head, tail = key.split(KEY_SEP, maxsplit=1)
+        return self.__schema__[int(head)][tail]
     
     def __setitem__(self, key, value):
-        if isinstance(key, str):
-            key = key.split(KEY_SEP, maxsplit=1)
-
-            if len(key) == 2:
-                self[int(key[0])][key[1]] = value
-                return
-            
-            self[int(key[0])] = value
+        if isinstance(key, int):
+            self.__schema__[key] = value
             return
 
-        if not isinstance(key, int):
+        if not isinstance(key, str):
             raise ValueError()
 
-        self.__schema__[key] = value
+        if KEY_SEP not in key:
+            self.__schema__[int(key)] = value
+            return
+
+        head, tail = key.split(KEY_SEP, maxsplit=1)
+        self.__schema__[int(head)][tail] = value
 
     @property
     def schema(self):
@@ -274,11 +577,11 @@ class SchemaTuple(Schema):
 
     @classmethod
     def __attr_keys__(cls):
-        return list(range(len(cls.dtypes)))
+        return cls.__attr_keys_cache__
     
     @classmethod
     def __attr_items__(cls):
-        return {k: cls.dtypes[k] for k in cls.__attr_keys__()}.items()
+        return cls.__attr_items_cache__
     
     @classmethod
     def fit(cls, schema: list, allow_defaults=True):
@@ -300,8 +603,8 @@ class SchemaTuple(Schema):
     @classmethod
     def empty(cls):
         empty = []
-        for _, dtype in cls.__attr_items__():
-            if not isinstance(dtype, tuple) and issubclass(dtype, Schema):
+        for dtype, nested in zip(cls.dtypes, cls.__nested_dtypes__):
+            if nested:
                 empty.append(dtype.empty())
                 continue
 
@@ -311,17 +614,153 @@ class SchemaTuple(Schema):
         return empty
 
 def get_auto_caster(cls, others, others_translation):
-    
+    # The casters are built once, rather than for every casted event
+    casters = [
+        other.get_caster(cls, other_translation) \
+            for other, other_translation in zip(others, others_translation)
+    ]
+
     def auto_caster(schema):
+        # The fitting schemas are built without validating them a second
+        # time in the constructors
         if cls.fit(schema):
-            return cls(schema)
+            return cls.__build__(schema)
         
-        for other, other_translation in zip(others, others_translation):
+        for other, caster in zip(others, casters):
             if other.fit(schema):
-                schema = other(schema)
-                caster = other.get_caster(cls, other_translation)
+                schema = other.__build__(schema)
                 return caster(schema)
 
         raise ValueError("`auto_caster` could not fit any of the provided schema definition.")
 
     return auto_caster
+
+# Per schema class column keys and compiled leaf getter, built on first use
+_COLUMNS_GETTERS = {}
+
+_NUMERIC_DTYPES = (int, float, bool)
+
+# Kinds of columns returned by `to_columns`
+_LIST_COLUMN, _NUMERIC_COLUMN, _NULLABLE_COLUMN = range(3)
+
+def _column_kind(dtype):
+    """
+    Get the kind of the column of a field from its dtype, the numeric fields
+    that may be None are nullable columns.
+    """
+    dtypes = dtype if isinstance(dtype, tuple) else (dtype,)
+    if all(d in _NUMERIC_DTYPES for d in dtypes):
+        return _NUMERIC_COLUMN
+    if NoneType in dtypes and \
+        all(d in _NUMERIC_DTYPES or d is NoneType for d in dtypes):
+        return _NULLABLE_COLUMN
+
+    return _LIST_COLUMN
+
+def _leaf_paths(cls, prefix=()):
+    """
+    Yield the path and dtype of every non-schema field of a schema class.
+    """
+    keys = cls.keys if issubclass(cls, SchemaDict) else range(len(cls.dtypes))
+    for key, dtype, nested in zip(keys, cls.dtypes, cls.__nested_dtypes__):
+        if nested:
+            yield from _leaf_paths(dtype, prefix + (key,))
+            continue
+
+        yield prefix + (key,), dtype
+
+def _get_leaf(schema, path):
+    """
+    Get the value at a path of nested schemas, or None when the path goes
+    through a default or missing value.
+    """
+    value = schema
+    for k in path:
+        if not isinstance(value, Schema):
+            return None
+        try:
+            value = value.__schema__[k]
+        except (KeyError, IndexError, TypeError):
+            return None
+
+    return value
+
+def _get_columns_getter(cls):
+    """
+    Build the column keys, the column kinds and a compiled function
+    returning the tuple of the leaf values of a schema class.
+    """
+    if cls in _COLUMNS_GETTERS:
+        return _COLUMNS_GETTERS[cls]
+
+    paths, dtypes = zip(*_leaf_paths(cls))
+    keys = tuple(KEY_SEP.join(map(str, path)) for path in paths)
+    kinds = tuple(_column_kind(dtype) for dtype in dtypes)
+
+    values = ", ".join(
+        "schema" + "".join(f".__schema__[{k!r}]" for k in path) \
+            for path in paths
+    )
+    namespace = {}
+    exec(compile(
+        f"def get_leaves(schema):\n    return ({values},)",
+        f"<{cls.__name__} leaves>", "exec"
+    ), namespace)
+
+    _COLUMNS_GETTERS[cls] = (keys, paths, kinds, namespace["get_leaves"])
+    return _COLUMNS_GETTERS[cls]
+
+def to_columns(schemas: Sequence[Schema]) -> Dict[str, List]:
+    """
+    Convert a sequence of schemas of a single class into columns, one per
+    non-schema field.
+
+    Parameters:
+    - schemas (Sequence[Schema]): The schemas, e.g. the casted events of a
+    batch.
+
+    Returns:
+    Dict[str, List]: Dictionary mapping the composite key of each field to the
+    column of its values. The columns of the int, float and bool fields are
+    NumPy arrays, the other columns are lists. The columns of these fields
+    holding None values, e.g. the (float, NoneType) fields, are float64
+    arrays with NaN in place of None.
+
+    Raises:
+    - ValueError: If the schemas are not all instances of the same class.
+
+    Note:
+    - The values of every schema are read with a single compiled function, and
+    the rows are transposed into columns at once. The fields under a default
+    or missing nested schema are None, or NaN in the numeric columns.
+    - `np.isnan` gives the validity mask of the nullable columns, which
+    cannot tell a None from a NaN value.
+    """
+    if not schemas:
+        return {}
+
+    cls = type(schemas[0])
+    if any(type(schema) is not cls for schema in schemas):
+        raise ValueError("`to_columns` expects schemas of a single class.")
+
+    keys, paths, kinds, get_leaves = _get_columns_getter(cls)
+
+    rows = []
+    for schema in schemas:
+        try:
+            rows.append(get_leaves(schema))
+        except (KeyError, IndexError, TypeError, AttributeError):
+            rows.append(tuple(_get_leaf(schema, path) for path in paths))
+
+    columns = {}
+    for key, kind, column in zip(keys, kinds, zip(*rows)):
+        if kind == _LIST_COLUMN:
+            columns[key] = list(column)
+        elif kind == _NULLABLE_COLUMN or None in column:
+            # NumPy converts None to NaN in float arrays, rather than
+            # building an object array
+            columns[key] = np.array(column, dtype=np.float64)
+        else:
+            columns[key] = np.array(column)
+
+    return columns
@@ -23,22 +23,46 @@ data.
 from a dictionary.
 - get_subdictionary(dictionary: Dict, prefix: str, sep: str, remove: bool=True)
 -> Dict: Get a subdictionary with keys starting with a specified prefix.
+- split_dictionary(dictionary: Dict, prefixes: Sequence[str], sep: str,
+remove: bool=True) -> Dict: Get the subdictionaries of several prefixes in a
+single pass.
+- parse_timestamp(string: str) -> float: Convert a Poleno event timestamp
+string into a POSIX timestamp.
 """
+import re
+import sys
+from datetime import datetime
 from typing import Any, Callable, Dict, Generator, Iterable, List, \
     Optional, Sequence, Tuple, Union
 from collections.abc import MutableMapping
 from itertools import islice
 
 import numpy as np
-import tensorflow as tf
+
+_TIMESTAMP_FORMAT = "%Y-%m-%d_%H.%M.%S.%f"
+_TIMESTAMP_PATTERN = re.compile(
+    r"(\d{4})-(\d\d)-(\d\d)_(\d\d)\.(\d\d)\.(\d\d)\.(\d{6})", re.ASCII
+)
+
+_FLATTENED_TYPES = (list, tuple, set, range)
 
 def flatten(iterable: Any) -> Generator:
     """Flatten a nested iterable."""
-    if isinstance(iterable, (list, tuple, set, range)):
-        for sub in iterable:
-            yield from flatten(sub)
-    else:
+    if not isinstance(iterable, _FLATTENED_TYPES):
         yield iterable
+        return
+
+    # The nesting is followed with an explicit stack of iterators instead of
+    # a generator per level, the leaves are yielded from a single frame
+    stack = [iter(iterable)]
+    while stack:
+        for el in stack[-1]:
+            if isinstance(el, _FLATTENED_TYPES):
+                stack.append(iter(el))
+                break
+            yield el
+        else:
+            stack.pop()
 
 def flatten_dictionary(
     dictionary: Dict,
@@ -46,16 +70,24 @@ def flatten_dictionary(
     separator: str='/'
 ) -> Dict:
     """Flatten a nested dictionary."""
-    items = []
-    for key, value in dictionary.items():
-        new_key = parent_key + separator + key if parent_key else key
-        if isinstance(value, MutableMapping):
-            items.extend(
-                flatten_dictionary(value, new_key, separator=separator).items()
-            )
+    # The nested dictionaries are followed with an explicit stack, all the
+    # leaves are inserted in a single dictionary, in the original order
+    flat = {}
+    stack = [(parent_key, iter(dictionary.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            new_key = prefix + separator + key if prefix else key
+            # The concrete dict check avoids the slower ABC check in the
+            # common case, other mappings are still flattened
+            if type(value) is dict or isinstance(value, MutableMapping):
+                stack.append((new_key, iter(value.items())))
+                break
+            flat[new_key] = value
         else:
-            items.append((new_key, value))
-    return dict(items)
+            stack.pop()
+
+    return flat
 
 def empty_structure(el: Any) -> Union[Dict, List, Tuple]:
     """Create an empty structure with the same shape as the input."""    
@@ -84,6 +116,21 @@ def append_to_structure(
     structure.append(el)
     return structure
 
+def _stack_arrays(arrays: List[np.ndarray]) -> np.ndarray:
+    # The arrays of a batch usually share their shape and dtype, they are then
+    # copied into a preallocated output, which skips the per-array expansion
+    # and checks of `np.stack`. Otherwise `np.stack` promotes the dtypes or
+    # raises on the mismatching shapes.
+    shape, dtype = arrays[0].shape, arrays[0].dtype
+    if not all(isinstance(a, np.ndarray) and a.shape == shape and \
+               a.dtype == dtype for a in arrays):
+        return np.stack(arrays)
+
+    out = np.empty((len(arrays),) + shape, dtype=dtype)
+    for i, a in enumerate(arrays):
+        out[i] = a
+    return out
+
 def flatten_structure(
     structure: Union[Dict, List, Tuple],
     list_strategy: Optional[str]=None,
@@ -129,11 +176,14 @@ def flatten_structure(
         if numpy_strategy == "concatenate":
             return np.concatenate(structure, axis=0)
         elif numpy_strategy == "stack":
-            return np.stack(structure)
+            return _stack_arrays(structure)
         else:
             raise NotImplementedError()
     
-    if isinstance(structure[0], tf.Tensor):
+    # TensorFlow is not imported by this module, a structure of tensors can
+    # only exist once it has been imported by the caller
+    tf = sys.modules.get("tensorflow")
+    if tf is not None and isinstance(structure[0], tf.Tensor):
         if numpy_strategy == "concatenate":
             return tf.concat(structure, axis=0).numpy()
         elif numpy_strategy == "stack":
@@ -179,11 +229,18 @@ def collate_fn(
         'c': {'d': [4, 8, 12]}
     }
     """
-    collated_batch = empty_structure(batch[0])
-    for el in batch:
-        collated_batch = append_to_structure(el, collated_batch)
-    collated_batch = flatten_structure(collated_batch, *args, **kwargs)
-    return collated_batch
+    # The batch is transposed level by level, each leaf is gathered in a
+    # single list and flattened once, without building an empty structure
+    # and appending every element of the batch to it
+    el = batch[0]
+    if isinstance(el, tuple):
+        return tuple(collate_fn(list(s), *args, **kwargs) for s in zip(*batch))
+
+    if isinstance(el, dict):
+        return {k: collate_fn([e[k] for e in batch], *args, **kwargs) \
+                    for k in el.keys()}
+
+    return flatten_structure(list(batch), *args, **kwargs)
 
 def batchify(
     iterable: Iterable,
@@ -316,3 +373,70 @@ def get_subdictionary(
 
     return {k: v for k, v in dictionary.items() \
                 if k.startswith(prefix)}
+
+def split_dictionary(
+    dictionary: Dict,
+    prefixes: Sequence[str],
+    sep: str,
+    remove: bool=True
+) -> Dict:
+    """
+    Get the subdictionaries of several prefixes in a single pass.
+
+    This function is equivalent to calling `get_subdictionary` once per
+    prefix, but it iterates over the input dictionary only once.
+
+    Parameters:
+    - dictionary (Dict): The input dictionary.
+    - prefixes (Sequence[str]): The prefixes used to filter keys.
+    - sep (str): The separator used in keys.
+    - remove (bool, optional): Whether to remove the prefix from the keys
+    (default is True).
+
+    Returns:
+    Dict: Dictionary mapping each prefix to its subdictionary.
+
+    Example:
+    # Example data
+    data = {'exw_key1': 42, 'inw_key2': 'value2', 'other_key': 'value3'}
+    split_dictionary(data, ['exw', 'inw'], '_')
+
+    # Output
+    # {'exw': {'key1': 42}, 'inw': {'key2': 'value2'}}
+    """
+    out = {prefix: {} for prefix in prefixes}
+    prefixes = [
+        (prefix, prefix if prefix[-1] == sep else prefix + sep) \
+            for prefix in prefixes
+    ]
+
+    for k, v in dictionary.items():
+        for prefix, full_prefix in prefixes:
+            if k.startswith(full_prefix):
+                out[prefix][k[len(full_prefix):] if remove else k] = v
+
+    return out
+
+def parse_timestamp(string: str) -> float:
+    """
+    Convert a Poleno event timestamp string into a POSIX timestamp.
+
+    This function is equivalent to
+    `datetime.strptime(string, "%Y-%m-%d_%H.%M.%S.%f").timestamp()`, the
+    fixed-width timestamps are parsed with a precompiled pattern rather than
+    by interpreting the format string on every call.
+
+    Parameters:
+    - string (str): The timestamp string, e.g. "2023-03-04_05.06.07.123456".
+
+    Returns:
+    float: The POSIX timestamp, the string being read as local time.
+
+    Raises:
+    - ValueError: If the string does not match the timestamp format.
+    """
+    match = _TIMESTAMP_PATTERN.fullmatch(string)
+    if match is None:
+        return datetime.strptime(string, _TIMESTAMP_FORMAT).timestamp()
+
+    return datetime(*map(int, match.groups())).timestamp()
@@ -2,6 +2,7 @@
 Base workers as decorators to define new workers for HPC.
 """
 
+import os
 import time
 from typing import Callable, Optional
 
@@ -14,7 +15,9 @@ from swisspollentools.utils.requests import *
 def getPullPushChannels(
     pull_port: int,
     push_port: int,
-    control_port: int
+    control_port: int,
+    transport: str="tcp",
+    ipc_dir: Optional[str]=None
 ):
     """
     Set up ZeroMQ channels for Pull-Push-Control communication.
@@ -23,6 +26,9 @@ def getPullPushChannels(
     - pull_port (int): Port for the PULL connection.
     - push_port (int): Port for the PUSH connection.
     - control_port (int): Port for the control connection (PUB/SUB channel).
+    - transport (str): The transport of the channels, "tcp" or "ipc".
+    - ipc_dir (Optional[str]): The directory of the socket files of the IPC
+    transport.
 
     Returns:
     Tuple[zmq.Context, zmq.Socket, zmq.Socket, zmq.Socket, zmq.Poller]:
@@ -36,15 +42,15 @@ def getPullPushChannels(
 
     # Set PULL connection
     receiver = context.socket(zmq.PULL)
-    receiver.connect(f"tcp://127.0.0.1:{pull_port}")
+    receiver.connect(get_address(pull_port, transport, ipc_dir))
 
     # Set PUSH connection
     sender = context.socket(zmq.PUSH)
-    sender.connect(f"tcp://127.0.0.1:{push_port}")
+    sender.connect(get_address(push_port, transport, ipc_dir))
 
     # Set control connection (PUB/SUB channel)
     control = context.socket(zmq.SUB)
-    control.connect(f"tcp://127.0.0.1:{control_port}")
+    control.connect(get_address(control_port, transport, ipc_dir))
     control.setsockopt_string(zmq.SUBSCRIBE, "")
 
     # Group the receiver (PULL, Control)
@@ -54,21 +60,45 @@ def getPullPushChannels(
 
     return context, receiver, sender, control, poller
 
+def set_cpu_affinity(
+    cpu: int,
+    callback: Optional[Callable]=None
+) -> None:
+    """
+    Pin the calling process to a CPU, then execute a callback.
+
+    This function is meant to be bound with `functools.partial` and used as
+    the `on_startup` callable of a worker or a scaffold, so that the process
+    keeps its caches warm instead of being migrated between CPUs.
+
+    Parameters:
+    - cpu (int): Index of the CPU to pin the process to.
+    - callback (Optional[Callable]): callable to be executed after the
+    pinning, does not take any arguments.
+
+    Returns:
+    None
+
+    Note:
+    - On platforms without `os.sched_setaffinity` the pinning is skipped and
+    only the callback is executed.
+    """
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cpu})
+
+    if callback is not None:
+        callback()
+
 def process_kwargs(**kwargs):
-    get_kwargs = {
-        k.removeprefix("get_"): v \
-            for k, v in kwargs.items() \
-            if k.startswith("get_")
-    }
-    for k, v in get_kwargs.items():
-        if isinstance(v, Callable):
-            get_kwargs[k] = v()
-        elif isinstance(v, Tuple):
-            get_kwargs[k] = v[0](*v[1:])
-
-    kwargs = {k: v for k, v in kwargs.items() \
-                if not k.startswith("get_")}
-    kwargs = {**kwargs, **get_kwargs}
+    # The `get_` arguments are replaced in place by the value they produce
+    for k in [k for k in kwargs if k.startswith("get_")]:
+        v = kwargs.pop(k)
+        if callable(v):
+            v = v()
+        elif isinstance(v, tuple):
+            v = v[0](*v[1:])
+
+        kwargs[k[4:]] = v
 
     return kwargs
 
@@ -84,6 +114,14 @@ def PullPushWorker(worker):
     def my_worker(request, config, **kwargs):
         # Worker implementation
         pass
+
+    Note:
+    - The end of a task is not sent as a separate EndOfTask message when the
+    worker yields responses: the last response is sent with the
+    `END_OF_TASK_KEY` header flag instead. Only a request without response
+    is followed by an EndOfTask message. The downstream consumers should
+    detect the end of the tasks with `haseot`; the Collator removes the flag
+    before passing the response to its `request_fn`.
     """
     def wrapper(
         config,
@@ -96,6 +134,8 @@ def PullPushWorker(worker):
         on_response: Optional[Callable]=None,
         on_failure: Optional[Callable]=None,
         on_closure: Optional[Callable]=None,
+        transport: str="tcp",
+        ipc_dir: Optional[str]=None,
         **kwargs
     ) -> None:
         """
@@ -118,6 +158,9 @@ def PullPushWorker(worker):
         within the worker, takes the error as unique argument.
         - on_closure (Callable): callable to be executed on the closure, does
         not take any arguments.
+        - transport (str): The transport of the channels, "tcp" or "ipc".
+        - ipc_dir (Optional[str]): The directory of the socket files of the
+        IPC transport.
         - **kwargs: Additional keyword arguments.
 
         Returns:
@@ -127,44 +170,67 @@ def PullPushWorker(worker):
             on_startup()
 
         ( context, receiver, sender,  control, poller ) = \
-            getPullPushChannels(pull_port, push_port, control_port)
-        time.sleep(LAUNCH_SLEEP_TIME)
+            getPullPushChannels(
+                pull_port, push_port, control_port, transport, ipc_dir
+            )
 
         kwargs = process_kwargs(**kwargs)
 
         # Message listening loop
-        timeout_start = time.time()
-        while time.time() < timeout_start + timeout:
-            socks = dict(poller.poll())
-
-            # Pulled messages case
-            if socks.get(receiver) == zmq.POLLIN:
-                request = recv_request(receiver)
-
-                if on_request is not None:
-                    on_request(request)
-
-                try:
-                    for response in worker(request, config, **kwargs):
-                        if on_response is not None:
-                            on_response(response)
-                        send_request(sender, response)
-                except Exception as e:
-                    if on_failure is not None:
-                        on_failure(e)
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            # The poller waits at most until the deadline, without limit for
+            # the default infinite timeout
+            events = poller.poll(
+                remaining * 1000 if remaining != float("inf") else None
+            )
+
+            # The events are listed in the registration order, the pulled
+            # messages are therefore handled before the control messages
+            stop = False
+            for socket, _ in events:
+                if socket is control:
+                    # Control messages case
+                    # If the worker receive an EOP message, the process
+                    # is terminated.
+                    stop = iseop(recv_request(control))
+                    continue
+
+                # Pulled messages case, all the queued requests are handled
+                # before polling again
+                while True:
+                    try:
+                        request = recv_request(receiver, flags=zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+
+                    if on_request is not None:
+                        on_request(request)
+
+                    # Each response is sent once the next one is generated,
+                    # so that the last one carries the end of the task
+                    # instead of a separate EndOfTask message
+                    last = None
+                    try:
+                        for response in worker(request, config, **kwargs):
+                            if on_response is not None:
+                                on_response(response)
+                            if last is not None:
+                                send_request(sender, last)
+                            last = response
+                    except Exception as e:
+                        if on_failure is not None:
+                            on_failure(e)
+                        else:
+                            raise Exception(e)
+
+                    if last is not None:
+                        send_request(sender, {**last, END_OF_TASK_KEY: True})
                     else:
-                        raise Exception(e)
-
-                send_request(sender, EndOfTask())                 
+                        send_end_of_task(sender)
 
-            # Control messages case
-            if socks.get(control) == zmq.POLLIN:
-                # If the worker receive an EOP message, the process
-                # is terminated.
-                request = recv_request(control)
-
-                if iseop(request):
-                    break
+            if stop:
+                break
 
         if on_closure is not None:
             on_closure()
@@ -195,6 +261,8 @@ def CollateWorker(worker):
         on_response: Optional[Callable]=None,
         on_failure: Optional[Callable]=None,
         on_closure: Optional[Callable]=None,
+        transport: str="tcp",
+        ipc_dir: Optional[str]=None,
         **kwargs
     ):
         """
@@ -217,6 +285,9 @@ def CollateWorker(worker):
         within the worker, takes the error as unique argument.
         - on_closure (Callable): callable to be executed on the closure, does
         not take any arguments.
+        - transport (str): The transport of the channels, "tcp" or "ipc".
+        - ipc_dir (Optional[str]): The directory of the socket files of the
+        IPC transport.
         - **kwargs: Additional keyword arguments.
 
         Returns:
@@ -226,35 +297,44 @@ def CollateWorker(worker):
             on_startup()
 
         ( context, receiver, sender,  control, poller ) = \
-            getPullPushChannels(pull_port, push_port, control_port)
-        time.sleep(LAUNCH_SLEEP_TIME)
+            getPullPushChannels(
+                pull_port, push_port, control_port, transport, ipc_dir
+            )
 
         kwargs = process_kwargs(**kwargs)
 
         # Message listening loop
-        timeout_start = time.time()
+        deadline = time.monotonic() + timeout
         requests = []
-        while time.time() < timeout_start + timeout:
-            socks = dict(poller.poll())
-
-            # Pulled messages case
-            if socks.get(receiver) == zmq.POLLIN:
-                request = recv_request(receiver)
-
-                if on_request is not None:
-                    on_request(request)
-
-                requests.append(request)
-                send_request(sender, EndOfTask())           
-
-            # Control messages case
-            if socks.get(control) == zmq.POLLIN:
-                # If the worker receive an EOP message, the process
-                # is terminated.
-                request = recv_request(control)
-
-                if iseop(request):
-                    break
+        while (remaining := deadline - time.monotonic()) > 0:
+            events = poller.poll(
+                remaining * 1000 if remaining != float("inf") else None
+            )
+
+            stop = False
+            for socket, _ in events:
+                if socket is control:
+                    # Control messages case
+                    # If the worker receive an EOP message, the process
+                    # is terminated.
+                    stop = iseop(recv_request(control))
+                    continue
+
+                # Pulled messages case
+                while True:
+                    try:
+                        request = recv_request(receiver, flags=zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+
+                    if on_request is not None:
+                        on_request(request)
+
+                    requests.append(request)
+                    send_end_of_task(sender)
+
+            if stop:
+                break
 
         try:
             response = worker(requests, config, **kwargs)
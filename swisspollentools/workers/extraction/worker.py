@@ -25,6 +25,7 @@ from io import BytesIO
 import tempfile
 import zipfile
 import json
+import orjson
 
 from typing import Dict, Generator, List, Tuple
 
@@ -168,7 +169,12 @@ def __zip_read_event(
         for two images (rec0 and rec1).
     """
     event = record.joinpath(event_id + suffix).read_bytes()
-    event = json.loads(event)
+    try:
+        event = orjson.loads(event)
+    except orjson.JSONDecodeError:
+        # orjson is strict JSON, the events using the NaN / Infinity literals
+        # or the non UTF-8 encodings are parsed by the standard library.
+        event = json.loads(event)
     event = auto_caster(event)
 
     metadata = event["metaData"].schema
@@ -518,12 +524,14 @@ def HDF5Extraction(
         raise ValueError()
     n_events = n_events[0]
 
+    array_keys = frozenset(k for k in keys if k.startswith(_NP_ARRAY_DATA_KEYS))
+
     for batch_id, start_slice in \
         enumerate(range(0, n_events, config.exw_batch_size)):
 
         data = {k: record[k][start_slice:min(start_slice+config.exw_batch_size, n_events)] \
                     for k in keys}
-        data = {k: v.tolist() if not k.startswith(_NP_ARRAY_DATA_KEYS) \
+        data = {k: v.tolist() if k not in array_keys \
                     else v \
                     for k, v in data.items()}
 
@@ -533,6 +541,24 @@ def HDF5Extraction(
             **data
         )
 
+def __csv_read_array(value: str) -> np.ndarray:
+    """
+    Parses an array written as a (nested) list in a CSV cell.
+
+    Parameters:
+    -----------
+    - value (str): The content of the CSV cell, e.g. "[0.1, 0.2, 0.3]".
+
+    Returns:
+    --------
+    - np.ndarray: The parsed array.
+    """
+    try:
+        return np.array(orjson.loads(value))
+    except orjson.JSONDecodeError:
+        # The cells that are not JSON arrays are evaluated as before.
+        return np.array(eval(value))
+
 def CSVExtraction(
     request: Dict,
     config: ExtractionWorkerConfig,
@@ -597,14 +623,16 @@ def CSVExtraction(
 
     n_events = len(record)
 
+    array_keys = frozenset(k for k in keys if k.startswith(_NP_ARRAY_DATA_KEYS))
+
     for batch_id, start_slice in \
         enumerate(range(0, n_events, config.exw_batch_size)):
 
         data = {k: record[k][start_slice:min(start_slice+config.exw_batch_size, n_events)] \
                     for k in keys}
         data = {
-            k: v.to_list() if not k.startswith(_NP_ARRAY_DATA_KEYS) \
-                else np.stack(v.apply(lambda el: np.array(eval(el))).to_list(), axis=0) \
+            k: v.to_list() if k not in array_keys \
+                else np.stack([__csv_read_array(el) for el in v], axis=0) \
                 for k, v in data.items()
         }
 
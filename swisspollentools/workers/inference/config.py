@@ -30,6 +30,9 @@ class InferenceWorkerConfig():
     input recordings for inference, default is (200, 200).
     - `inw_rec_precision` (int): Integer specifying the bit precision for the
     input recordings, default is 16.
+    - `inw_rec_dtype` (str): Floating point dtype of the normalized
+    recordings fed to the model. Using "float32" or "float16" halves or
+    quarters the memory moved per batch, default is "float64".
     - `inw_batch_size` (int): Integer specifying the batch size for inference,
     default is 1024.
     - `inw_post_processing_fn` (InitVar[Optional[Callable]]): Initial variable
@@ -42,6 +45,7 @@ class InferenceWorkerConfig():
     inw_from_fluorescence_keys: InitVar[Optional[Union[Dict, List]]]=None
     inw_rec_shape: Tuple[int, int]=(200, 200)
     inw_rec_precision: int=16
+    inw_rec_dtype: str="float64"
     inw_batch_size: int=1024
     inw_pre_processing_fn: InitVar[Optional[Callable]]=None
     inw_post_processing_fn: InitVar[Optional[Callable]]=None
@@ -26,8 +26,11 @@ def InferenceRequest(
     if not ismsg(response):
         raise ValueError()
 
-    metadata = get_subdictionary(response, METADATA_KEY, KEY_SEP)
-    fluorescence_data = get_subdictionary(response, FLUODATA_KEY, KEY_SEP)
+    subdictionaries = split_dictionary(
+        response, (METADATA_KEY, FLUODATA_KEY), KEY_SEP
+    )
+    metadata = subdictionaries[METADATA_KEY]
+    fluorescence_data = subdictionaries[FLUODATA_KEY]
     rec0 = response[REC0_KEY] if REC0_KEY in response.keys() else None
     rec1 = response[REC1_KEY] if REC1_KEY in response.keys() else None
 
@@ -89,8 +92,11 @@ def parseinreq(msg: Dict) -> Tuple[Dict, Dict, List[int], List[int]]:
             "Calling `parseinreq` on non Inference Request dictionnary"
         )
     
-    metadata = get_subdictionary(msg, METADATA_KEY, KEY_SEP)
-    fluorescence_data = get_subdictionary(msg, FLUODATA_KEY, KEY_SEP)
+    subdictionaries = split_dictionary(
+        msg, (METADATA_KEY, FLUODATA_KEY), KEY_SEP
+    )
+    metadata = subdictionaries[METADATA_KEY]
+    fluorescence_data = subdictionaries[FLUODATA_KEY]
     rec0 = msg[REC0_KEY] if REC0_KEY in msg.keys() else None
     rec1 = msg[REC1_KEY] if REC1_KEY in msg.keys() else None
 
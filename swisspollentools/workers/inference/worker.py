@@ -41,6 +41,7 @@ def Inference(
 
     Raises:
     - RuntimeError: If the "model" key is not present in the keyword arguments.
+    - ValueError: If the request does not hold any event.
 
     Example:
     request_msg = InReq(
@@ -53,6 +54,7 @@ def Inference(
         inw_from_fluorescence_keys={"channel_1": "ch1", "channel_2": "ch2"},
         inw_rec_shape=(200, 200),
         inw_rec_precision=16,
+        inw_rec_dtype="float32",
         inw_batch_size=1024,
         inw_post_processing_fn=my_post_processing_function
     )
@@ -73,8 +75,13 @@ def Inference(
         new_key: fluorescence_data[old_key] \
             for old_key, new_key in config.inw_from_fluorescence_keys.items()
     }
-    rec0 = rec0 / 2 ** config.inw_rec_precision
-    rec1 = rec1 / 2 ** config.inw_rec_precision
+    # The division is computed in at least single precision and only then
+    # cast, a float16 divisor of 2 ** 16 would overflow to inf
+    rec_dtype = np.dtype(config.inw_rec_dtype)
+    compute_dtype = np.result_type(rec_dtype, np.float32)
+    scale = 2 ** config.inw_rec_precision
+    rec0 = np.divide(rec0, scale, dtype=compute_dtype).astype(rec_dtype, copy=False)
+    rec1 = np.divide(rec1, scale, dtype=compute_dtype).astype(rec_dtype, copy=False)
 
     dataset = {
         "fluorescence_data": fluorescence_data if config.inw_from_fluorescence else None,
@@ -87,7 +94,15 @@ def Inference(
     dataset = dataset.batch(config.inw_batch_size, num_parallel_calls=tf.data.AUTOTUNE)
     dataset = dataset.prefetch(buffer_size=tf.data.AUTOTUNE)
 
-    predictions = kwargs["model"].predict(dataset, verbose=0)
+    # The batches are fed to the model's cached predict function, skipping
+    # the per-call setup of `predict` (data handler, callbacks, progress bar)
+    # which dominates for the small datasets of a single request.
+    predictions = [kwargs["model"].predict_on_batch(batch) for batch in dataset]
+    if not predictions:
+        raise ValueError("The Inference Request does not hold any event.")
+    predictions = tf.nest.map_structure(
+        lambda *batches: np.concatenate(batches, axis=0), *predictions
+    )
     predictions = config.inw_post_processing_fn(predictions)
 
     yield InferenceResponse(